@@ -6,10 +6,12 @@ and other accessibility features for better AI understanding.
 """
 
 from typing import Dict, Any, Optional
+import soupsieve
 from bs4 import BeautifulSoup, Tag
 
 from ..types.dom_data_types import AccessibilityInfo
-from ..types.element_data_types import AccessibilityRole
+from ..types.element_data_types import AccessibilityRole, ARIA_ROLE_TO_ACCESSIBILITY_ROLE
+from ..utils.tag_index import analysis_scoped, get_tag_index
 
 
 class AccessibilityAnalyzer:
@@ -20,27 +22,45 @@ class AccessibilityAnalyzer:
     information to improve AI interaction with web content.
     """
     
+    # ARIA role attribute value -> AccessibilityRole
+    _ROLE_MAP = ARIA_ROLE_TO_ACCESSIBILITY_ROLE
+    
+    # aria-* suffix -> AccessibilityInfo field, grouped by how the value is parsed
+    _ARIA_LIST_FIELDS = {'describedby': 'described_by', 'labelledby': 'labelled_by'}
+    _ARIA_BOOL_FIELDS = {'hidden': 'hidden', 'disabled': 'disabled', 'required': 'required'}
+    
+    # Main landmark selector, compiled once rather than per page
+    _MAIN_LANDMARK_SELECTOR = soupsieve.compile('main, [role="main"]')
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize Accessibility Analyzer."""
         self.config = config or {}
     
+    @analysis_scoped
     async def analyze_accessibility(self, soup: BeautifulSoup) -> AccessibilityInfo:
         """Analyze overall page accessibility."""
         page_accessibility = AccessibilityInfo()
+        tag_index = get_tag_index(soup)
         
         # Find page title
-        title_elem = soup.find('title')
-        if title_elem:
-            page_accessibility.label = title_elem.get_text(strip=True)
+        title_text = tag_index.title_text()
+        if title_text is not None:
+            page_accessibility.label = title_text
         
         # Check for main landmark
-        main_elem = soup.find(['main', '[role="main"]'])
+        main_elem = self._MAIN_LANDMARK_SELECTOR.select_one(soup)
         if main_elem:
             page_accessibility.role = AccessibilityRole.MAIN
         
         # Count accessibility features
-        aria_elements = soup.find_all(lambda tag: any(attr.startswith('aria-') for attr in tag.attrs))
-        page_accessibility.attributes['aria_elements_count'] = len(aria_elements)
+        aria_elements_count = 0
+        for element in tag_index.elements:
+            if element.attrs:
+                for attr in element.attrs:
+                    if attr.startswith('aria-'):
+                        aria_elements_count += 1
+                        break
+        page_accessibility.attributes['aria_elements_count'] = aria_elements_count
         
         return page_accessibility
     
@@ -50,30 +70,32 @@ class AccessibilityAnalyzer:
         
         # Extract ARIA attributes
         for attr_name, attr_value in element.attrs.items():
-            if attr_name.startswith('aria-'):
-                aria_name = attr_name[5:]  # Remove 'aria-' prefix
-                
-                if aria_name == 'label':
-                    accessibility_info.label = attr_value
-                elif aria_name == 'describedby':
-                    accessibility_info.described_by = attr_value.split()
-                elif aria_name == 'labelledby':
-                    accessibility_info.labelled_by = attr_value.split()
-                elif aria_name == 'hidden':
-                    accessibility_info.hidden = attr_value.lower() == 'true'
-                elif aria_name == 'disabled':
-                    accessibility_info.disabled = attr_value.lower() == 'true'
-                elif aria_name == 'required':
-                    accessibility_info.required = attr_value.lower() == 'true'
-                else:
-                    accessibility_info.attributes[attr_name] = attr_value
+            if attr_name[:5] != 'aria-':
+                continue
+            aria_name = attr_name[5:]  # Remove 'aria-' prefix
+            
+            if aria_name == 'label':
+                accessibility_info.label = attr_value
+                continue
+            
+            field_name = self._ARIA_LIST_FIELDS.get(aria_name)
+            if field_name is not None:
+                setattr(accessibility_info, field_name, attr_value.split())
+                continue
+            
+            field_name = self._ARIA_BOOL_FIELDS.get(aria_name)
+            if field_name is not None:
+                setattr(accessibility_info, field_name, attr_value.lower() == 'true')
+            else:
+                accessibility_info.attributes[attr_name] = attr_value
         
         # Extract role
         role = element.get('role')
         if role:
-            try:
-                accessibility_info.role = AccessibilityRole(role.upper())
-            except ValueError:
+            role_enum = self._ROLE_MAP.get(role.lower())
+            if role_enum is not None:
+                accessibility_info.role = role_enum
+            else:
                 accessibility_info.attributes['role'] = role
         
         return accessibility_info
\ No newline at end of file
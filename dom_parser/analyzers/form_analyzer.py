@@ -5,15 +5,53 @@ Identifies form elements, field types, validation requirements,
 and form submission patterns for automated form interaction.
 """
 
-from typing import List, Dict, Any, Optional
+import re
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from bs4 import BeautifulSoup, Tag
 
 from ..types.dom_data_types import (
     FormStructure, InteractiveElement, AccessibilityInfo
 )
 from ..types.element_data_types import (
-    FormFieldType, SemanticType
+    ElementType, FormFieldType, SemanticType
 )
+from ..utils.tag_index import analysis_scoped, get_tag_index
+
+# Tags collected as form fields
+FORM_FIELD_TAGS = ('input', 'textarea', 'select', 'button')
+
+# Keywords looked for in a form's classes and id, grouped by the form type
+# they indicate; earlier groups take precedence
+_FORM_TYPE_KEYWORDS = (
+    (SemanticType.LOGIN_FORM, ('login', 'signin', 'auth')),
+    (SemanticType.SEARCH_FORM, ('search', 'query')),
+    (SemanticType.REGISTRATION_FORM, ('register', 'signup', 'create')),
+    (SemanticType.CONTACT_FORM, ('contact', 'message', 'feedback')),
+)
+_FORM_KEYWORD_PRIORITY = {
+    keyword: priority
+    for priority, (_, keywords) in enumerate(_FORM_TYPE_KEYWORDS)
+    for keyword in keywords
+}
+# Lookahead so overlapping keywords are all reported in a single scan
+_FORM_KEYWORD_RE = re.compile('(?=(%s))' % '|'.join(_FORM_KEYWORD_PRIORITY))
+
+
+@lru_cache(maxsize=1024)
+def _form_type_from_keywords(form_classes: Tuple[str, ...], form_id: str) -> Optional[SemanticType]:
+    """
+    Match form type keywords against a form's classes and id.
+    
+    Cached because the same class/id combinations recur across the forms
+    of a page and across pages of a site.
+    """
+    # The space separator can't be part of a keyword match
+    keywords = _FORM_KEYWORD_RE.findall(f"{' '.join(form_classes).lower()} {form_id.lower()}")
+    if not keywords:
+        return None
+    priority = min(_FORM_KEYWORD_PRIORITY[keyword] for keyword in keywords)
+    return _FORM_TYPE_KEYWORDS[priority][0]
 
 
 class FormAnalyzer:
@@ -24,23 +62,62 @@ class FormAnalyzer:
     and submission mechanisms for intelligent form automation.
     """
     
+    # <input> type attribute -> element type / form field type
+    _INPUT_ELEMENT_TYPES = {
+        'checkbox': ElementType.CHECKBOX,
+        'radio': ElementType.RADIO,
+        'submit': ElementType.SUBMIT,
+        'button': ElementType.SUBMIT,
+    }
+    _INPUT_FIELD_TYPES = {
+        'text': FormFieldType.TEXT,
+        'email': FormFieldType.EMAIL,
+        'password': FormFieldType.PASSWORD,
+        'tel': FormFieldType.PHONE,
+        'url': FormFieldType.URL,
+        'search': FormFieldType.SEARCH,
+        'number': FormFieldType.NUMBER,
+        'date': FormFieldType.DATE,
+        'time': FormFieldType.TIME,
+        'checkbox': FormFieldType.CHECKBOX,
+        'radio': FormFieldType.RADIO,
+        'file': FormFieldType.FILE,
+        'submit': FormFieldType.SUBMIT,
+        'button': FormFieldType.BUTTON,
+    }
+    
+    # Other field tags -> element type / form field type
+    _TAG_ELEMENT_TYPES = {
+        'textarea': ElementType.TEXTAREA,
+        'select': ElementType.SELECT,
+        'button': ElementType.BUTTON,
+    }
+    _TAG_FIELD_TYPES = {
+        'textarea': FormFieldType.TEXTAREA,
+        'button': FormFieldType.BUTTON,
+    }
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize Form Analyzer."""
         self.config = config or {}
     
+    @analysis_scoped
     async def analyze_forms(self, soup: BeautifulSoup) -> List[FormStructure]:
         """Analyze all forms in the document."""
-        forms = []
-        form_elements = soup.find_all('form')
-        
-        for idx, form_element in enumerate(form_elements):
-            form_structure = await self._analyze_single_form(form_element, idx)
-            forms.append(form_structure)
-        
-        return forms
+        tag_index = get_tag_index(soup)
+        form_elements = tag_index.find_all('form')
+        if not form_elements:
+            return []
+        
+        # Forms are independent and the work is pure CPU, so analyze them
+        # in a plain loop rather than scheduling a coroutine per form; each
+        # form's fields are sliced from the tag index by its subtree range
+        return [self._analyze_single_form(form_element, idx,
+                                          tag_index.find_all_within(form_element, FORM_FIELD_TAGS))
+                for idx, form_element in enumerate(form_elements)]
     
-    async def _analyze_single_form(self, form_element: Tag, idx: int) -> FormStructure:
-        """Analyze a single form element."""
+    def _analyze_single_form(self, form_element: Tag, idx: int, field_elements: List[Tag]) -> FormStructure:
+        """Analyze a single form element given its field elements."""
         form_id = f"form_{idx}"
         
         # Extract form attributes
@@ -48,29 +125,40 @@ class FormAnalyzer:
         method = form_element.get('method', 'GET').upper()
         enctype = form_element.get('enctype', 'application/x-www-form-urlencoded')
         
-        # Find form fields
-        field_elements = form_element.find_all(['input', 'textarea', 'select', 'button'])
         fields = []
         submit_buttons = []
         required_fields = []
         
         for field_idx, field_element in enumerate(field_elements):
             field_id = f"field_{idx}_{field_idx}"
+            tag_name = field_element.name
+            
+            # Resolve element and field type from the lookup tables
+            if tag_name == 'input':
+                input_type = field_element.get('type', 'text').lower()
+                element_type = self._INPUT_ELEMENT_TYPES.get(input_type, ElementType.INPUT)
+                form_field_type = self._INPUT_FIELD_TYPES.get(input_type, FormFieldType.TEXT)
+            elif tag_name == 'select':
+                element_type = ElementType.SELECT
+                form_field_type = FormFieldType.MULTISELECT if field_element.has_attr('multiple') else FormFieldType.SELECT
+            else:
+                element_type = self._TAG_ELEMENT_TYPES.get(tag_name, ElementType.UNKNOWN)
+                form_field_type = self._TAG_FIELD_TYPES.get(tag_name)
             
             # Create basic InteractiveElement for the field
             field = InteractiveElement(
                 element_id=field_id,
-                element_type=self._get_field_element_type(field_element),
-                tag_name=field_element.name,
+                element_type=element_type,
+                tag_name=tag_name,
                 text_content=field_element.get_text(strip=True),
-                form_field_type=self._get_form_field_type(field_element)
+                form_field_type=form_field_type
             )
             
             fields.append(field)
             
             # Check for submit buttons
-            if (field_element.name == 'button' or 
-                (field_element.name == 'input' and field_element.get('type') in ['submit', 'button'])):
+            if (tag_name == 'button' or 
+                (tag_name == 'input' and field_element.get('type') in ['submit', 'button'])):
                 submit_buttons.append(field_id)
             
             # Check for required fields
@@ -95,94 +183,27 @@ class FormAnalyzer:
         
         return form_structure
     
-    def _get_field_element_type(self, element: Tag):
-        """Get element type for form field."""
-        from ..types.element_data_types import ElementType
-        
-        if element.name == 'input':
-            input_type = element.get('type', 'text').lower()
-            if input_type == 'checkbox':
-                return ElementType.CHECKBOX
-            elif input_type == 'radio':
-                return ElementType.RADIO
-            elif input_type in ['submit', 'button']:
-                return ElementType.SUBMIT
-            else:
-                return ElementType.INPUT
-        elif element.name == 'textarea':
-            return ElementType.TEXTAREA
-        elif element.name == 'select':
-            return ElementType.SELECT
-        elif element.name == 'button':
-            return ElementType.BUTTON
-        
-        return ElementType.UNKNOWN
-    
-    def _get_form_field_type(self, element: Tag) -> Optional[FormFieldType]:
-        """Determine form field type."""
-        if element.name == 'input':
-            input_type = element.get('type', 'text').lower()
-            mapping = {
-                'text': FormFieldType.TEXT,
-                'email': FormFieldType.EMAIL,
-                'password': FormFieldType.PASSWORD,
-                'tel': FormFieldType.PHONE,
-                'url': FormFieldType.URL,
-                'search': FormFieldType.SEARCH,
-                'number': FormFieldType.NUMBER,
-                'date': FormFieldType.DATE,
-                'time': FormFieldType.TIME,
-                'checkbox': FormFieldType.CHECKBOX,
-                'radio': FormFieldType.RADIO,
-                'file': FormFieldType.FILE,
-                'submit': FormFieldType.SUBMIT,
-                'button': FormFieldType.BUTTON,
-            }
-            return mapping.get(input_type, FormFieldType.TEXT)
-        elif element.name == 'textarea':
-            return FormFieldType.TEXTAREA
-        elif element.name == 'select':
-            return FormFieldType.MULTISELECT if element.has_attr('multiple') else FormFieldType.SELECT
-        elif element.name == 'button':
-            return FormFieldType.BUTTON
-        
-        return None
-    
     def _determine_form_type(self, form_element: Tag, fields: List[InteractiveElement]) -> Optional[SemanticType]:
         """Determine the semantic type of the form."""
-        # Analyze form attributes and field types
-        form_classes = ' '.join(form_element.get('class', [])).lower()
-        form_id = form_element.get('id', '').lower()
-        
-        # Check for login forms
-        if any(keyword in form_classes or keyword in form_id 
-               for keyword in ['login', 'signin', 'auth']):
-            return SemanticType.LOGIN_FORM
-        
-        # Check for search forms
-        if any(keyword in form_classes or keyword in form_id 
-               for keyword in ['search', 'query']):
-            return SemanticType.SEARCH_FORM
-        
-        # Check for registration forms
-        if any(keyword in form_classes or keyword in form_id 
-               for keyword in ['register', 'signup', 'create']):
-            return SemanticType.REGISTRATION_FORM
-        
-        # Check for contact forms
-        if any(keyword in form_classes or keyword in form_id 
-               for keyword in ['contact', 'message', 'feedback']):
-            return SemanticType.CONTACT_FORM
+        # Check for login, search, registration and contact keywords in the
+        # form's classes and id; most forms have neither, so skip the scan then
+        form_classes = form_element.get('class')
+        form_id = form_element.get('id', '')
+        if form_classes or form_id:
+            form_type = _form_type_from_keywords(tuple(form_classes or ()), form_id)
+            if form_type is not None:
+                return form_type
         
         # Analyze field types
         field_types = [field.form_field_type for field in fields if field.form_field_type]
+        field_type_set = set(field_types)
         
         # Login form patterns
-        if (FormFieldType.EMAIL in field_types or FormFieldType.TEXT in field_types) and FormFieldType.PASSWORD in field_types:
+        if (FormFieldType.EMAIL in field_type_set or FormFieldType.TEXT in field_type_set) and FormFieldType.PASSWORD in field_type_set:
             return SemanticType.LOGIN_FORM
         
         # Search form patterns
-        if FormFieldType.SEARCH in field_types or (len(field_types) == 1 and FormFieldType.TEXT in field_types):
+        if FormFieldType.SEARCH in field_type_set or (len(field_types) == 1 and FormFieldType.TEXT in field_type_set):
             return SemanticType.SEARCH_FORM
         
         return None
\ No newline at end of file
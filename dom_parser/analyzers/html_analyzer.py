@@ -5,11 +5,43 @@ Provides core HTML parsing functionality using BeautifulSoup and lxml,
 with error handling for malformed HTML and various document types.
 """
 
-import re
-from typing import Optional, Dict, Any, List
-from bs4 import BeautifulSoup, Comment
-import lxml
-from lxml import etree
+from typing import Optional, Dict, Any, List, Set
+from bs4 import BeautifulSoup, Comment, SoupStrainer, Tag
+from bs4.builder import builder_registry
+from ..utils.tag_index import analysis_scoped, get_tag_index, get_tree_cache
+
+try:
+    from bs4.builder import LXMLTreeBuilder
+    DEFAULT_PARSER = 'lxml'
+    
+    class CommentlessLXMLTreeBuilder(LXMLTreeBuilder):
+        """lxml tree builder that drops comments instead of adding them to the tree."""
+        
+        def comment(self, text):
+            # Still close off pending text, so the strings around a comment
+            # stay separate nodes just as if the comment had been extracted
+            self.soup.endData()
+except ImportError:
+    # Fall back to the built-in parser if lxml isn't installed
+    DEFAULT_PARSER = 'html.parser'
+    CommentlessLXMLTreeBuilder = None
+
+# Text inside these elements is left as-is by whitespace normalization
+RAW_TEXT_TAGS = frozenset({'script', 'style'})
+
+# Elements that can be empty and still meaningful
+SELF_CLOSING_TAGS = frozenset({'img', 'input', 'br', 'hr', 'meta', 'link', 'area',
+                               'base', 'col', 'embed', 'source', 'track', 'wbr'})
+
+# Tags kept when parsing only for metadata: the <head> subtree, plus any
+# title/meta/link tags a parser moved out of it
+METADATA_TAGS = frozenset({'head', 'title', 'meta', 'link'})
+
+# <meta name="..."> values copied straight into the metadata fields of the same name
+META_NAME_FIELDS = frozenset({'description', 'keywords', 'author', 'viewport', 'robots'})
+
+# Input types that don't need an associated label
+UNLABELLED_INPUT_TYPES = frozenset({'hidden', 'submit', 'button'})
 
 
 class HTMLAnalyzer:
@@ -29,26 +61,50 @@ class HTMLAnalyzer:
         """
         self.config = config or {}
         
-        # Parser preferences (in order of preference)
-        self.parsers = self.config.get('parsers', ['lxml', 'html.parser', 'html5lib'])
+        # Primary parser backend, followed by fallbacks (in order of preference).
+        # html5lib is opt-in through 'parsers': it is far slower than lxml,
+        # and lxml already recovers from malformed markup
+        self.parser = self.config.get('parser', DEFAULT_PARSER)
+        fallbacks = [p for p in ('html.parser',) if p != self.parser]
+        parsers = self.config.get('parsers', [self.parser] + fallbacks)
         self.remove_comments = self.config.get('remove_comments', True)
         self.remove_scripts = self.config.get('remove_scripts', True)
         self.remove_styles = self.config.get('remove_styles', True)
         self.normalize_whitespace = self.config.get('normalize_whitespace', True)
         
+        # Tags dropped entirely during cleaning
+        self._stripped_tags = [tag for tag, remove in (('script', self.remove_scripts),
+                                                       ('style', self.remove_styles)) if remove]
+        
         # Parser options
         self.parser_options = self.config.get('parser_options', {
             'lxml': {'features': 'lxml'},
             'html.parser': {'features': 'html.parser'},
             'html5lib': {'features': 'html5lib'}
         })
+        
+        # When comments are removed anyway, let the lxml builder skip them
+        # while parsing instead of walking the tree for them afterwards
+        self._parser_kwargs = dict(self.parser_options)
+        if (self.remove_comments and CommentlessLXMLTreeBuilder is not None
+                and self.parser_options.get('lxml') == {'features': 'lxml'}):
+            self._parser_kwargs['lxml'] = {'builder': CommentlessLXMLTreeBuilder}
+        
+        # Resolve the backends once: a parser whose library isn't installed
+        # would otherwise fail, and fall back, on every single page
+        self.parsers = [
+            parser for parser in parsers
+            if builder_registry.lookup(self.parser_options.get(parser, {}).get('features', parser))
+        ]
     
-    async def parse_html(self, html_source: str) -> BeautifulSoup:
+    async def parse_html(self, html_source: str, strain_tags: Optional[Set[str]] = None) -> BeautifulSoup:
         """
         Parse HTML source into BeautifulSoup DOM tree.
         
         Args:
             html_source: Raw HTML source code
+            strain_tags: If given, only these tags (with their contents) are
+                built into the tree; the rest of the document is skipped
             
         Returns:
             BeautifulSoup DOM tree object
@@ -56,17 +112,18 @@ class HTMLAnalyzer:
         Raises:
             Exception: If all parsers fail to parse the HTML
         """
-        if not html_source or not html_source.strip():
+        # isspace() checks for blank input without copying the whole source
+        if not html_source or html_source.isspace():
             raise ValueError("HTML source is empty or None")
         
         # Try parsers in order of preference
         last_error = None
         for parser in self.parsers:
             try:
-                soup = self._parse_with_parser(html_source, parser)
+                soup = self._parse_with_parser(html_source, parser, strain_tags)
                 if soup:
                     # Clean and normalize the parsed tree
-                    await self._clean_dom_tree(soup)
+                    self._clean_dom_tree(soup)
                     return soup
             except Exception as e:
                 last_error = e
@@ -78,164 +135,180 @@ class HTMLAnalyzer:
         else:
             raise Exception("Failed to parse HTML with any available parser")
     
-    def _parse_with_parser(self, html_source: str, parser: str) -> Optional[BeautifulSoup]:
+    def _parse_with_parser(self, html_source: str, parser: str,
+                           strain_tags: Optional[Set[str]] = None) -> Optional[BeautifulSoup]:
         """
         Parse HTML with a specific parser.
         
         Args:
             html_source: Raw HTML source
             parser: Parser name to use
+            strain_tags: Tags to restrict the parse to, if any
             
         Returns:
-            BeautifulSoup object or None if parsing failed
+            BeautifulSoup object or None if the document has no elements
+            
+        Raises:
+            Exception: Parser errors are propagated so parse_html can report them
         """
-        parser_opts = self.parser_options.get(parser, {})
+        parser_opts = self._parser_kwargs.get(parser, {})
+        if strain_tags:
+            parser_opts = dict(parser_opts, parse_only=SoupStrainer(list(strain_tags)))
         
-        try:
-            # Handle encoding issues
-            if isinstance(html_source, bytes):
-                html_source = html_source.decode('utf-8', errors='replace')
-            
-            # Create BeautifulSoup object
-            soup = BeautifulSoup(html_source, **parser_opts)
-            
-            # Basic validation
-            if not soup or not soup.find():
-                return None
-            
-            return soup
-            
-        except Exception as e:
-            # Log parser-specific errors if needed
+        # Handle encoding issues
+        if isinstance(html_source, bytes):
+            html_source = html_source.decode('utf-8', errors='replace')
+        
+        # Create BeautifulSoup object
+        soup = BeautifulSoup(html_source, **parser_opts)
+        
+        # Basic validation; a strained parse may legitimately match nothing
+        if not strain_tags and not soup.find():
             return None
+        
+        return soup
     
-    async def _clean_dom_tree(self, soup: BeautifulSoup) -> None:
+    def _clean_dom_tree(self, soup: BeautifulSoup) -> None:
         """
         Clean and normalize the DOM tree.
         
         Args:
             soup: BeautifulSoup DOM tree to clean
         """
-        # Remove comments
-        if self.remove_comments:
+        # Remove script and style tags in a single pass over the tree
+        stripped_tags = self._stripped_tags
+        if stripped_tags:
+            for element in soup.find_all(stripped_tags):
+                element.decompose()
+        
+        # Normalize whitespace in text content, removing comments in the
+        # same pass over the text nodes
+        if self.normalize_whitespace:
+            self._normalize_text_content(soup)
+        elif self.remove_comments and type(soup.builder) is not CommentlessLXMLTreeBuilder:
             for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
                 comment.extract()
         
-        # Remove script tags
-        if self.remove_scripts:
-            for script in soup.find_all('script'):
-                script.decompose()
-        
-        # Remove style tags
-        if self.remove_styles:
-            for style in soup.find_all('style'):
-                style.decompose()
-        
-        # Normalize whitespace in text content
-        if self.normalize_whitespace:
-            await self._normalize_text_content(soup)
-        
         # Remove empty elements that serve no purpose
-        await self._remove_empty_elements(soup)
+        self._remove_empty_elements(soup)
         
         # Fix common HTML issues
-        await self._fix_common_issues(soup)
+        self._fix_common_issues(soup)
     
-    async def _normalize_text_content(self, soup: BeautifulSoup) -> None:
+    def _normalize_text_content(self, soup: BeautifulSoup) -> None:
         """
         Normalize whitespace in text content.
         
+        Comments are removed here as well when remove_comments is set, so
+        the text nodes are only walked once.
+        
         Args:
             soup: BeautifulSoup DOM tree
         """
+        remove_comments = self.remove_comments
         for element in soup.find_all(string=True):
-            if element.parent.name in ['script', 'style']:
+            if remove_comments and isinstance(element, Comment):
+                element.extract()
                 continue
             
-            # Normalize whitespace
-            normalized = re.sub(r'\s+', ' ', str(element).strip())
-            if normalized != str(element):
+            if element.parent.name in RAW_TEXT_TAGS:
+                continue
+            
+            # Collapse whitespace runs; str.split() splits on the same
+            # characters as \s, without going through the regex engine
+            normalized = ' '.join(element.split())
+            if normalized != element:
                 element.replace_with(normalized)
     
-    async def _remove_empty_elements(self, soup: BeautifulSoup) -> None:
+    def _remove_empty_elements(self, soup: BeautifulSoup) -> None:
         """
         Remove elements that are empty and serve no purpose.
         
         Args:
             soup: BeautifulSoup DOM tree
         """
-        # Elements that can be empty and still meaningful
-        self_closing_tags = {'img', 'input', 'br', 'hr', 'meta', 'link', 'area', 'base', 'col', 'embed', 'source', 'track', 'wbr'}
-        
         # Find empty elements
         for element in soup.find_all():
-            if element.name in self_closing_tags:
+            if element.name in SELF_CLOSING_TAGS:
                 continue
             
-            # Check if element is truly empty (no text, no children with content)
-            if not element.get_text(strip=True) and not element.find_all():
-                # Check if it has important attributes
-                important_attrs = {'id', 'class', 'data-*', 'aria-*'}
-                has_important_attrs = any(
-                    attr in element.attrs for attr in important_attrs
-                ) or any(
-                    attr.startswith('data-') or attr.startswith('aria-') 
-                    for attr in element.attrs
+            # Check if element is truly empty (no text, no children with content).
+            # Only leaves can qualify, so check for child tags first and only
+            # collect text from leaves, instead of walking every subtree
+            if any(isinstance(child, Tag) for child in element.contents):
+                continue
+            if not element.get_text(strip=True):
+                # Check if it has important attributes: id, class, data-* or aria-*
+                attrs = element.attrs
+                has_important_attrs = 'id' in attrs or 'class' in attrs or any(
+                    attr[:5] in ('data-', 'aria-') for attr in attrs
                 )
                 
                 if not has_important_attrs:
                     element.decompose()
     
-    async def _fix_common_issues(self, soup: BeautifulSoup) -> None:
+    def _fix_common_issues(self, soup: BeautifulSoup) -> None:
         """
         Fix common HTML structure issues.
         
         Args:
             soup: BeautifulSoup DOM tree
         """
+        # The tree's structure is final at this point, so the fixes below
+        # can read tag buckets from one index of it
+        tag_index = get_tag_index(soup)
+        
         # Fix missing alt attributes on images
-        for img in soup.find_all('img'):
+        for img in tag_index.find_all('img'):
             if not img.get('alt'):
                 img['alt'] = ''
         
         # Ensure form elements have proper structure
-        for form in soup.find_all('form'):
+        for form in tag_index.find_all('form'):
             if not form.get('action'):
                 form['action'] = ''
             if not form.get('method'):
                 form['method'] = 'GET'
         
         # Add missing type attributes to input elements
-        for input_elem in soup.find_all('input'):
+        for input_elem in tag_index.find_all('input'):
             if not input_elem.get('type'):
                 input_elem['type'] = 'text'
     
+    @analysis_scoped
     def get_dom_statistics(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """
         Get statistics about the DOM tree.
         
+        Within an analysis scope the result is cached, so repeated calls
+        for the same document don't walk it again. Each call returns its
+        own copy.
+        
         Args:
             soup: BeautifulSoup DOM tree
             
         Returns:
             Dictionary with DOM statistics
         """
+        tree_cache = get_tree_cache(soup)
+        cached_stats = tree_cache.get('dom_statistics') if tree_cache is not None else None
+        if cached_stats is not None:
+            return dict(cached_stats, tag_counts=dict(cached_stats['tag_counts']))
+        
+        # All counts come from the tag index's single walk of the tree
+        tag_index = get_tag_index(soup)
+        tag_counts = {tag: len(elements) for tag, elements in tag_index.by_tag.items()}
         stats = {
-            'total_elements': len(soup.find_all()),
-            'text_nodes': len(soup.find_all(string=True)),
-            'tag_counts': {},
+            'total_elements': tag_index.total_elements,
+            'text_nodes': tag_index.text_node_count,
+            'tag_counts': tag_counts,
             'depth': 0,
             'interactive_elements': 0,
             'form_elements': 0,
-            'image_elements': len(soup.find_all('img')),
-            'link_elements': len(soup.find_all('a')),
+            'image_elements': tag_counts.get('img', 0),
+            'link_elements': tag_counts.get('a', 0),
         }
         
-        # Count tags
-        for element in soup.find_all():
-            tag = element.name
-            stats['tag_counts'][tag] = stats['tag_counts'].get(tag, 0) + 1
-        
         # Count interactive elements
         interactive_tags = {'button', 'input', 'select', 'textarea', 'a'}
         for tag in interactive_tags:
@@ -249,7 +322,9 @@ class HTMLAnalyzer:
         # Calculate maximum depth
         stats['depth'] = self._calculate_max_depth(soup)
         
-        return stats
+        if tree_cache is not None:
+            tree_cache['dom_statistics'] = stats
+        return dict(stats, tag_counts=dict(tag_counts))
     
     def _calculate_max_depth(self, soup: BeautifulSoup) -> int:
         """
@@ -261,20 +336,19 @@ class HTMLAnalyzer:
         Returns:
             Maximum depth as integer
         """
-        def get_depth(element, current_depth=0):
-            if not hasattr(element, 'children'):
-                return current_depth
-            
-            max_child_depth = current_depth
-            for child in element.children:
-                if hasattr(child, 'name') and child.name:
-                    child_depth = get_depth(child, current_depth + 1)
-                    max_child_depth = max(max_child_depth, child_depth)
-            
-            return max_child_depth
-        
-        return get_depth(soup)
+        # Elements are in document order, so a parent's depth is always known
+        # before its children are reached; no recursion needed
+        depths: Dict[int, int] = {}
+        max_depth = 0
+        for element in get_tag_index(soup).elements:
+            depth = depths.get(id(element.parent), 0) + 1
+            depths[id(element)] = depth
+            if depth > max_depth:
+                max_depth = depth
+        
+        return max_depth
     
+    @analysis_scoped
     def validate_html_structure(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """
         Validate HTML structure and identify potential issues.
@@ -287,9 +361,10 @@ class HTMLAnalyzer:
         """
         issues = []
         warnings = []
+        tag_index = get_tag_index(soup)
         
         # Check for missing title
-        if not soup.find('title'):
+        if not tag_index.find('title'):
             warnings.append("Missing <title> element")
         
         # Check for missing doctype
@@ -297,28 +372,37 @@ class HTMLAnalyzer:
             warnings.append("Missing DOCTYPE declaration")
         
         # Check for missing meta charset
-        charset_meta = soup.find('meta', attrs={'charset': True}) or \
-                     soup.find('meta', attrs={'http-equiv': 'Content-Type'})
-        if not charset_meta:
+        has_charset = any(meta.get('charset') is not None or meta.get('http-equiv') == 'Content-Type'
+                          for meta in tag_index.find_all('meta'))
+        if not has_charset:
             warnings.append("Missing charset declaration")
         
         # Check for forms without labels
-        forms = soup.find_all('form')
+        forms = tag_index.find_all('form')
         for form in forms:
-            inputs = form.find_all('input', attrs={'type': lambda x: x not in ['hidden', 'submit', 'button']})
+            # Collect the form's inputs and label targets in one subtree walk
+            inputs = []
+            labelled_ids = set()
+            for element in form.find_all(['input', 'label']):
+                if element.name == 'input':
+                    if element.get('type') not in UNLABELLED_INPUT_TYPES:
+                        inputs.append(element)
+                else:
+                    labelled_ids.add(element.get('for'))
+            
             for input_elem in inputs:
                 input_id = input_elem.get('id')
-                label = form.find('label', attrs={'for': input_id}) if input_id else None
-                if not label and not input_elem.get('aria-label') and not input_elem.get('aria-labelledby'):
+                has_label = bool(input_id) and input_id in labelled_ids
+                if not has_label and not input_elem.get('aria-label') and not input_elem.get('aria-labelledby'):
                     warnings.append(f"Input element missing label: {input_elem}")
         
         # Check for images without alt text
-        for img in soup.find_all('img'):
+        for img in tag_index.find_all('img'):
             if not img.get('alt') and img.get('alt') != '':
                 warnings.append(f"Image missing alt attribute: {img.get('src', 'unknown')}")
         
         # Check for links without text
-        for link in soup.find_all('a'):
+        for link in tag_index.find_all('a'):
             if not link.get_text(strip=True) and not link.get('aria-label'):
                 warnings.append(f"Link without text or aria-label: {link.get('href', 'unknown')}")
         
@@ -330,16 +414,41 @@ class HTMLAnalyzer:
             'total_warnings': len(warnings)
         }
     
+    async def extract_metadata_only(self, html_source: str) -> Dict[str, Any]:
+        """
+        Extract metadata from HTML source without building the page body.
+        
+        Only the <head> subtree and stray title/meta/link tags are parsed.
+        The <html> element itself is skipped, so 'language' is not reported.
+        
+        Args:
+            html_source: Raw HTML source code
+            
+        Returns:
+            Dictionary with extracted metadata
+        """
+        soup = await self.parse_html(html_source, strain_tags=METADATA_TAGS)
+        return self.extract_metadata(soup)
+    
+    @analysis_scoped
     def extract_metadata(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """
         Extract metadata from HTML document.
         
+        The result is cached within an analysis scope and copied, like
+        get_dom_statistics.
+        
         Args:
             soup: BeautifulSoup DOM tree
             
         Returns:
             Dictionary with extracted metadata
         """
+        tree_cache = get_tree_cache(soup)
+        cached_metadata = tree_cache.get('metadata') if tree_cache is not None else None
+        if cached_metadata is not None:
+            return self._copy_metadata(cached_metadata)
+        
         metadata = {
             'title': None,
             'description': None,
@@ -354,42 +463,48 @@ class HTMLAnalyzer:
             'robots': None
         }
         
+        tag_index = get_tag_index(soup)
+        
         # Extract title
-        title_elem = soup.find('title')
-        if title_elem:
-            metadata['title'] = title_elem.get_text(strip=True)
+        title_text = tag_index.title_text()
+        if title_text is not None:
+            metadata['title'] = title_text
         
         # Extract meta tags
-        for meta in soup.find_all('meta'):
+        for meta in tag_index.find_all('meta'):
             name = meta.get('name', '').lower()
-            property_attr = meta.get('property', '').lower()
-            content = meta.get('content', '')
+            if name in META_NAME_FIELDS:
+                metadata[name] = meta.get('content', '')
+                continue
+            
+            charset = meta.get('charset')
+            if charset:
+                metadata['charset'] = charset
+                continue
             
-            if name == 'description':
-                metadata['description'] = content
-            elif name == 'keywords':
-                metadata['keywords'] = content
-            elif name == 'author':
-                metadata['author'] = content
-            elif name == 'viewport':
-                metadata['viewport'] = content
-            elif name == 'robots':
-                metadata['robots'] = content
-            elif meta.get('charset'):
-                metadata['charset'] = meta.get('charset')
-            elif property_attr.startswith('og:'):
-                metadata['open_graph'][property_attr[3:]] = content
-            elif name.startswith('twitter:'):
-                metadata['twitter_card'][name[8:]] = content
+            # Open Graph and Twitter card tags are keyed by their suffix
+            property_attr = meta.get('property', '').lower()
+            if property_attr[:3] == 'og:':
+                metadata['open_graph'][property_attr[3:]] = meta.get('content', '')
+            elif name[:8] == 'twitter:':
+                metadata['twitter_card'][name[8:]] = meta.get('content', '')
         
         # Extract canonical URL
-        canonical = soup.find('link', attrs={'rel': 'canonical'})
+        canonical = next((link for link in tag_index.find_all('link')
+                          if 'canonical' in link.get('rel', ())), None)
         if canonical:
             metadata['canonical_url'] = canonical.get('href')
         
         # Extract language
-        html_elem = soup.find('html')
+        html_elem = tag_index.find('html')
         if html_elem:
             metadata['language'] = html_elem.get('lang')
         
-        return metadata
\ No newline at end of file
+        if tree_cache is not None:
+            tree_cache['metadata'] = metadata
+        return self._copy_metadata(metadata)
+    
+    def _copy_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy extracted metadata, including its Open Graph and Twitter card dicts."""
+        return dict(metadata, open_graph=dict(metadata['open_graph']),
+                    twitter_card=dict(metadata['twitter_card']))
\ No newline at end of file
@@ -8,6 +8,9 @@ AI-driven web interaction.
 
 import time
 import asyncio
+import hashlib
+from collections import OrderedDict
+from operator import itemgetter
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 from loguru import logger
@@ -38,6 +41,11 @@ from .semantic_extractor import SemanticExtractor
 from ..analyzers.form_analyzer import FormAnalyzer
 from ..analyzers.accessibility_analyzer import AccessibilityAnalyzer
 from .structure_mapper import StructureMapper
+from ..utils.tag_index import analysis_scope, get_tag_index
+
+# Characters of page source encoded per hashing step, so building a cache
+# key never holds a full UTF-8 copy of a very large page
+CACHE_KEY_CHUNK_SIZE = 1 << 20
 
 
 class DOMParser:
@@ -66,13 +74,17 @@ class DOMParser:
         self.accessibility_analyzer = AccessibilityAnalyzer(self.config.get('accessibility_analyzer', {}))
         self.structure_mapper = StructureMapper(self.config.get('structure_mapper', {}))
         
+        # Cache settings, read once rather than from config on every parse
+        self._cache_enabled = bool(self.config.get('enable_cache', True))
+        self._max_cache_size = int(self.config.get('max_cache_size', 100))
+        
         # Analysis state
         self._last_analysis: Optional[DOMAnalysisResult] = None
-        self._analysis_cache: Dict[str, DOMAnalysisResult] = {}
+        self._analysis_cache: "OrderedDict[str, DOMAnalysisResult]" = OrderedDict()
         
         self.logger.info("DOM Parser initialized", extra={
-            "cache_enabled": self.config.get('enable_cache', True),
-            "max_cache_size": self.config.get('max_cache_size', 100)
+            "cache_enabled": self._cache_enabled,
+            "max_cache_size": self._max_cache_size
         })
     
     async def parse_page(self, html_source: str, url: str, metadata: Optional[Dict[str, Any]] = None) -> DOMAnalysisResult:
@@ -87,7 +99,7 @@ class DOMParser:
         Returns:
             Complete DOM analysis result
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         metadata = metadata or {}
         
         self.logger.info("Starting DOM analysis", extra={
@@ -97,61 +109,71 @@ class DOMParser:
         })
         
         try:
-            # Check cache first
-            cache_key = self._generate_cache_key(html_source, url)
-            if self.config.get('enable_cache', True) and cache_key in self._analysis_cache:
-                self.logger.info("Returning cached analysis result")
-                return self._analysis_cache[cache_key]
+            # Check cache first; the key hashes the whole page, so only
+            # compute it when caching is on
+            cache_key = None
+            if self._cache_enabled:
+                cache_key = self._generate_cache_key(html_source, url)
+                cached_result = self._analysis_cache.get(cache_key)
+                if cached_result is not None:
+                    self._analysis_cache.move_to_end(cache_key)
+                    self.logger.info("Returning cached analysis result")
+                    return cached_result
             
             # Step 1: Parse HTML structure
             dom_tree = await self.html_analyzer.parse_html(html_source)
             
-            # Step 2: Extract and classify interactive elements
-            interactive_elements = await self.extract_interactive_elements(dom_tree)
-            
-            # Step 3: Analyze page structure
-            page_structure = await self.analyze_page_structure(dom_tree)
-            
-            # Step 4: Extract semantic blocks
-            semantic_blocks = await self.extract_semantic_blocks(dom_tree)
-            
-            # Step 5: Analyze forms
-            form_structures = await self.analyze_forms(dom_tree)
-            
-            # Step 6: Extract navigation structure
-            navigation_structure = await self.extract_navigation_elements(dom_tree)
-            
-            # Step 7: Perform accessibility analysis
-            accessibility_tree = await self.accessibility_analyzer.analyze_accessibility(dom_tree)
-            
-            # Step 8: Generate performance hints
-            performance_hints = await self._generate_performance_hints(dom_tree, interactive_elements)
-            
-            # Step 9: Build element relationships
-            element_relationships = await self._build_element_relationships(interactive_elements)
-            
-            # Create element index for quick lookup
-            element_index = {elem.element_id: elem for elem in interactive_elements}
-            
-            # Build final result
-            analysis_result = DOMAnalysisResult(
-                page_structure=page_structure,
-                interactive_elements=interactive_elements,
-                semantic_blocks=semantic_blocks,
-                form_structures=form_structures,
-                navigation_structure=navigation_structure,
-                accessibility_tree=accessibility_tree,
-                performance_hints=performance_hints,
-                element_relationships=element_relationships,
-                element_index=element_index,
-                source_url=url,
-                source_title=await self._extract_page_title(dom_tree),
-                processing_time=time.time() - start_time,
-                metadata=metadata
-            )
+            # Analyze the tree inside one scope, so every analyzer shares a
+            # single traversal of it and the caches built from it
+            with analysis_scope(dom_tree):
+                # Steps 2-7 only read the shared tree and fill disjoint result
+                # fields, so schedule them together rather than one after another:
+                # interactive elements, page structure, semantic blocks, forms,
+                # navigation structure and accessibility analysis
+                (
+                    interactive_elements,
+                    page_structure,
+                    semantic_blocks,
+                    form_structures,
+                    navigation_structure,
+                    accessibility_tree,
+                ) = await asyncio.gather(
+                    self.extract_interactive_elements(dom_tree),
+                    self.analyze_page_structure(dom_tree),
+                    self.extract_semantic_blocks(dom_tree),
+                    self.analyze_forms(dom_tree),
+                    self.extract_navigation_elements(dom_tree),
+                    self.accessibility_analyzer.analyze_accessibility(dom_tree),
+                )
+                
+                # Step 8: Generate performance hints
+                performance_hints = await self._generate_performance_hints(dom_tree, interactive_elements)
+                
+                # Step 9: Build element relationships
+                element_relationships = await self._build_element_relationships(interactive_elements)
+                
+                # Create element index for quick lookup
+                element_index = {elem.element_id: elem for elem in interactive_elements}
+                
+                # Build final result
+                analysis_result = DOMAnalysisResult(
+                    page_structure=page_structure,
+                    interactive_elements=interactive_elements,
+                    semantic_blocks=semantic_blocks,
+                    form_structures=form_structures,
+                    navigation_structure=navigation_structure,
+                    accessibility_tree=accessibility_tree,
+                    performance_hints=performance_hints,
+                    element_relationships=element_relationships,
+                    element_index=element_index,
+                    source_url=url,
+                    source_title=await self._extract_page_title(dom_tree),
+                    processing_time=time.perf_counter() - start_time,
+                    metadata=metadata
+                )
             
             # Cache result
-            if self.config.get('enable_cache', True):
+            if self._cache_enabled:
                 self._cache_result(cache_key, analysis_result)
             
             self._last_analysis = analysis_result
@@ -171,7 +193,7 @@ class DOMParser:
             return DOMAnalysisResult(
                 page_structure=PageStructure(),
                 source_url=url,
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 errors=[f"Analysis failed: {str(e)}"],
                 metadata=metadata
             )
@@ -300,18 +322,17 @@ class DOMParser:
         if not target:
             return []
         
-        similar_elements = []
-        for element in self._last_analysis.interactive_elements:
-            if element.element_id == target_element_id:
-                continue
-                
-            similarity_score = self._calculate_element_similarity(target, element)
-            if similarity_score > 0.7:  # Threshold for similarity
-                similar_elements.append(element)
+        # Keep each score next to its element so sorting doesn't recompute it
+        scored_elements = [
+            (similarity_score, element)
+            for element in self._last_analysis.interactive_elements
+            if element.element_id != target_element_id
+            and (similarity_score := self._calculate_element_similarity(target, element)) > 0.7
+        ]
         
         # Sort by similarity (highest first)
-        similar_elements.sort(key=lambda x: self._calculate_element_similarity(target, x), reverse=True)
-        return similar_elements
+        scored_elements.sort(key=itemgetter(0), reverse=True)
+        return [element for _, element in scored_elements]
     
     async def get_accessibility_info(self, element_id: str) -> Optional[AccessibilityInfo]:
         """
@@ -342,35 +363,37 @@ class DOMParser:
     
     def _generate_cache_key(self, html_source: str, url: str) -> str:
         """Generate a cache key for the analysis result."""
-        import hashlib
-        content = f"{url}:{len(html_source)}:{hash(html_source)}"
-        return hashlib.md5(content.encode()).hexdigest()
+        # Hash the raw content: the builtin hash() is salted per process,
+        # which made keys unstable across runs
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(url.encode('utf-8', 'surrogatepass'))
+        hasher.update(b'\0')
+        for start in range(0, len(html_source), CACHE_KEY_CHUNK_SIZE):
+            chunk = html_source[start:start + CACHE_KEY_CHUNK_SIZE]
+            hasher.update(chunk.encode('utf-8', 'surrogatepass'))
+        return hasher.hexdigest()
     
     def _cache_result(self, cache_key: str, result: DOMAnalysisResult) -> None:
-        """Cache an analysis result."""
-        max_size = self.config.get('max_cache_size', 100)
-        
-        if len(self._analysis_cache) >= max_size:
-            # Remove oldest entry
-            oldest_key = next(iter(self._analysis_cache))
-            del self._analysis_cache[oldest_key]
-        
+        """Cache an analysis result, evicting the least recently used entry."""
         self._analysis_cache[cache_key] = result
+        self._analysis_cache.move_to_end(cache_key)
+        
+        while len(self._analysis_cache) > self._max_cache_size:
+            self._analysis_cache.popitem(last=False)
     
     async def _extract_page_title(self, dom_tree) -> Optional[str]:
         """Extract page title from DOM tree."""
         try:
-            title_element = dom_tree.find('title')
-            return title_element.get_text(strip=True) if title_element else None
+            return get_tag_index(dom_tree).title_text()
         except Exception:
             return None
     
     async def _generate_performance_hints(self, dom_tree, interactive_elements: List[InteractiveElement]) -> Dict[str, Any]:
         """Generate performance optimization hints."""
         hints = {
-            "total_elements": len(dom_tree.find_all()),
+            "total_elements": get_tag_index(dom_tree).total_elements,
             "interactive_elements": len(interactive_elements),
-            "forms": len([e for e in interactive_elements if e.element_type == ElementType.FORM]),
+            "forms": sum(1 for e in interactive_elements if e.element_type is ElementType.FORM),
             "complexity": "low"
         }
         
@@ -388,7 +411,7 @@ class DOMParser:
         
         return hints
     
-    async def _build_element_relationships(self, interactive_elements: List[InteractiveElement]) -> Dict[str, List[str]]:
+    async def _build_element_relationships(self, interactive_elements: List[InteractiveElement]) -> Dict[str, Dict[str, Any]]:
         """Build relationships between elements."""
         relationships = {}
         
@@ -415,14 +438,14 @@ class DOMParser:
             score += 0.2
         
         # Similar text content
+        # (token sets are cached on the elements, so the target is tokenized once)
         if element1.text_content and element2.text_content:
-            text_similarity = len(set(element1.text_content.lower().split()) & 
-                                set(element2.text_content.lower().split())) / \
-                            max(len(element1.text_content.split()), len(element2.text_content.split()))
+            text_similarity = len(element1.text_tokens & element2.text_tokens) / \
+                            max(element1.text_word_count, element2.text_word_count, 1)
             score += text_similarity * 0.2
         
         # Similar attributes
-        common_attrs = set(element1.attributes.keys()) & set(element2.attributes.keys())
+        common_attrs = element1.attributes.keys() & element2.attributes.keys()
         if common_attrs:
             attr_similarity = len(common_attrs) / max(len(element1.attributes), len(element2.attributes))
             score += attr_similarity * 0.3
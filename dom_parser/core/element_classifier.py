@@ -5,9 +5,15 @@ Analyzes DOM elements to classify them into interactive vs content elements,
 determines interaction capabilities, and provides semantic meaning.
 """
 
+import asyncio
 import re
 import uuid
-from typing import List, Dict, Any, Optional, Set
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from sys import intern
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Set, Tuple
 from bs4 import BeautifulSoup, Tag
 
 from ..types.dom_data_types import (
@@ -16,10 +22,67 @@ from ..types.dom_data_types import (
 from ..types.element_data_types import (
     ElementType, InteractionType, SemanticType, FormFieldType,
     HTML_TAG_TO_ELEMENT_TYPE, INPUT_TYPE_TO_FORM_FIELD_TYPE,
-    get_interactive_element_types
+    ARIA_ROLE_TO_ACCESSIBILITY_ROLE, get_interactive_element_types
 )
 from ..utils.css_selector_generator import CSSSelectorsGenerator
 from ..utils.xpath_generator import XPathGenerator
+from ..utils.tag_index import TagIndex, analysis_scoped, get_tag_index
+
+
+_INTERACTIVE_ELEMENT_TYPES = get_interactive_element_types()
+# Tags whose element type can be interactive; any other tag needs attributes to qualify
+_INTERACTIVE_TAGS = frozenset({'input'} | {
+    tag_name for tag_name, element_type in HTML_TAG_TO_ELEMENT_TYPE.items()
+    if element_type in _INTERACTIVE_ELEMENT_TYPES
+})
+_CLICK_ELEMENT_TYPES = frozenset({ElementType.BUTTON, ElementType.LINK, ElementType.SUBMIT})
+_TYPE_ELEMENT_TYPES = frozenset({ElementType.INPUT, ElementType.TEXTAREA})
+_CHOICE_ELEMENT_TYPES = frozenset({ElementType.CHECKBOX, ElementType.RADIO})
+
+_NON_TYPE_INPUT_TYPES = frozenset({'submit', 'button', 'checkbox', 'radio', 'file'})
+_BUTTON_INPUT_TYPES = frozenset({'submit', 'button'})
+_DATE_INPUT_TYPES = frozenset({'date', 'datetime-local', 'time'})
+_SELF_CLOSING = frozenset({'img', 'input', 'br', 'hr', 'meta', 'link'})
+_FOCUSABLE_TAGS = frozenset({'input', 'textarea', 'select', 'button'})
+_HOVER_TAGS = frozenset({'abbr', 'acronym'})
+_BUTTON_TEXT_TAGS = frozenset({'button', 'input'})
+_GENERIC_CONTAINER_TAGS = frozenset({'div', 'span'})
+_TEST_ID_ATTRIBUTES = frozenset({'data-testid', 'data-cy', 'data-test'})
+
+# One bit per interaction type, in the order interactions are reported
+_INTERACTION_BITS = {
+    interaction_type: 1 << bit
+    for bit, interaction_type in enumerate((
+        InteractionType.CLICK, InteractionType.TYPE, InteractionType.SELECT,
+        InteractionType.MULTI_SELECT, InteractionType.UPLOAD, InteractionType.RANGE_SELECT,
+        InteractionType.COLOR_PICK, InteractionType.DATE_PICK, InteractionType.HOVER,
+        InteractionType.FOCUS, InteractionType.BLUR, InteractionType.SUBMIT,
+        InteractionType.NAVIGATE,
+    ))
+}
+
+# Indicators are substring matches, so each group is one compiled alternation
+_SEARCH_INDICATORS = re.compile('search|query|find')
+_LOGIN_INDICATORS = re.compile('login|signin|sign-in|auth|user')
+_NAV_INDICATORS = re.compile('nav|menu|header|breadcrumb')
+
+# Default text patterns per semantic type, in priority order; each
+# classifier works from its own editable copy
+_SEMANTIC_PATTERNS: Mapping[SemanticType, Tuple[str, ...]] = MappingProxyType({
+    SemanticType.SEARCH_FORM: ('search', 'find', 'query', 'lookup'),
+    SemanticType.LOGIN_FORM: ('login', 'sign in', 'log in', 'signin', 'authenticate'),
+    SemanticType.REGISTRATION_FORM: ('register', 'sign up', 'signup', 'create account'),
+    SemanticType.CONTACT_FORM: ('contact', 'message', 'feedback', 'inquiry'),
+    SemanticType.CHECKOUT_FORM: ('checkout', 'payment', 'billing', 'purchase'),
+    SemanticType.CART: ('cart', 'basket', 'bag', 'shopping'),
+    SemanticType.WISHLIST: ('wishlist', 'favorites', 'saved', 'bookmark'),
+    SemanticType.SOCIAL_MEDIA: ('share', 'like', 'follow', 'tweet', 'facebook', 'twitter'),
+    SemanticType.ADVERTISEMENT: ('ad', 'advertisement', 'sponsor', 'promoted'),
+    SemanticType.COOKIE_BANNER: ('cookie', 'privacy', 'accept', 'consent'),
+})
+
+# Inline styles that hide an element, allowing whitespace around the colon
+_HIDDEN_STYLE_RE = re.compile(r'display\s*:\s*none|visibility\s*:\s*hidden', re.IGNORECASE)
 
 
 class ElementClassifier:
@@ -30,6 +93,21 @@ class ElementClassifier:
     and interaction patterns for AI-driven web automation.
     """
     
+    # ARIA attribute (without the "aria-" prefix) -> AccessibilityInfo field
+    _ARIA_LIST_FIELDS = {'describedby': 'described_by', 'labelledby': 'labelled_by'}
+    _ARIA_BOOL_FIELDS = {
+        'hidden': 'hidden', 'disabled': 'disabled', 'required': 'required',
+        'invalid': 'invalid', 'expanded': 'expanded', 'checked': 'checked',
+    }
+    
+    # Interactive role and class indicators, compiled once for all instances
+    _interactive_roles = frozenset({
+        'button', 'link', 'menuitem', 'tab', 'option', 'checkbox', 'radio'
+    })
+    _interactive_class_re = re.compile(
+        '|'.join(map(re.escape, ['btn', 'button', 'link', 'click', 'toggle', 'submit'])), re.IGNORECASE
+    )
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize Element Classifier with configuration.
@@ -48,15 +126,29 @@ class ElementClassifier:
         self.confidence_threshold = self.config.get('confidence_threshold', 0.7)
         self.include_hidden_elements = self.config.get('include_hidden_elements', False)
         
+        # Number of elements classified between yields to the event loop
+        self.batch_size = max(1, int(self.config.get('batch_size', 512)))
+        
+        # LRU of attribute-derived classification results, shared by
+        # identical elements (repeated nav items, list entries) across pages
+        self._max_classification_cache_size = int(self.config.get('classification_cache_size', 4096))
+        self._classification_cache: "OrderedDict[Tuple, Tuple]" = OrderedDict()
+        
         # Interactive element indicators
         self.interactive_attributes = {
             'onclick', 'onmousedown', 'onmouseup', 'onkeypress', 'onkeydown',
             'href', 'data-toggle', 'data-target', 'data-dismiss', 'role'
         }
         
-        # Semantic classification patterns
-        self.semantic_patterns = self._load_semantic_patterns()
+        # Semantic classification patterns; may be edited per classifier,
+        # and edits take effect from the next classify_elements call
+        self.semantic_patterns = {
+            semantic_type: list(patterns)
+            for semantic_type, patterns in self._load_semantic_patterns().items()
+        }
+        self._semantic_pattern_groups = self._get_semantic_pattern_groups()
     
+    @analysis_scoped
     async def classify_elements(self, soup: BeautifulSoup) -> List[InteractiveElement]:
         """
         Classify all elements in the DOM tree.
@@ -69,75 +161,114 @@ class ElementClassifier:
         """
         interactive_elements = []
         
-        # Find all potentially interactive elements
-        all_elements = soup.find_all()
-        
-        for element in all_elements:
-            if not isinstance(element, Tag):
-                continue
-            
-            # Skip if element is hidden and we're not including hidden elements
-            if not self.include_hidden_elements and self._is_hidden_element(element):
-                continue
-            
-            # Classify the element
-            classified_element = await self._classify_single_element(element, soup)
+        # Pick up edits to semantic_patterns; cached classifications made
+        # with other patterns no longer apply
+        pattern_groups = self._get_semantic_pattern_groups()
+        if pattern_groups != self._semantic_pattern_groups:
+            self._semantic_pattern_groups = pattern_groups
+            self._classification_cache.clear()
+        
+        # Walk the shared document-order index rather than re-traversing the tree
+        tag_index = get_tag_index(soup)
+        elements = tag_index.elements
+        
+        # The filters below run for every element in the document, so the
+        # methods they call are looked up once rather than per element
+        get_element_type = self._get_element_type
+        has_interactive_attributes_of = self._has_interactive_attributes
+        is_hidden_element = self._is_hidden_element
+        include_hidden_elements = self.include_hidden_elements
+        
+        for batch_start in range(0, len(elements), self.batch_size):
+            # Classification is CPU-bound, so hand control back to the event
+            # loop between batches to let concurrently scheduled analyses run
+            if batch_start:
+                await asyncio.sleep(0)
             
-            if classified_element:
-                interactive_elements.append(classified_element)
+            for element in elements[batch_start:batch_start + self.batch_size]:
+                # Attribute-less elements of non-interactive tags (most text and
+                # layout markup) cannot qualify, so drop them before any other work
+                if not element.attrs and element.name.lower() not in _INTERACTIVE_TAGS:
+                    continue
+                
+                # Determine basic element type
+                element_type = get_element_type(element)
+                
+                # Skip non-interactive elements unless they have interactive attributes;
+                # most elements stop here, before any per-element classification work.
+                # The attribute check is only needed (and only known) for the latter
+                has_interactive_attributes = None
+                if element_type not in _INTERACTIVE_ELEMENT_TYPES:
+                    if not has_interactive_attributes_of(element):
+                        continue
+                    has_interactive_attributes = True
+                
+                # Skip if element is hidden and we're not including hidden elements
+                is_hidden = is_hidden_element(element)
+                if is_hidden and not include_hidden_elements:
+                    continue
+                
+                # Classify the element
+                interactive_elements.append(self._classify_single_element(
+                    element, element_type, soup, tag_index,
+                    is_visible=not is_hidden,
+                    has_interactive_attributes=has_interactive_attributes,
+                ))
         
         # Build element relationships
-        await self._build_element_relationships(interactive_elements, soup)
+        self._build_element_relationships(interactive_elements, soup)
         
         return interactive_elements
     
-    async def _classify_single_element(self, element: Tag, soup: BeautifulSoup) -> Optional[InteractiveElement]:
+    def _classify_single_element(self, element: Tag, element_type: ElementType,
+                                 soup: BeautifulSoup, tag_index: TagIndex, is_visible: bool,
+                                 has_interactive_attributes: Optional[bool] = None) -> InteractiveElement:
         """
-        Classify a single DOM element.
+        Classify a single interactive DOM element.
         
         Args:
             element: BeautifulSoup Tag element
+            element_type: Element type from _get_element_type
             soup: Full DOM tree for context
+            tag_index: Index of the DOM tree
+            is_visible: Result of the hidden-element check
+            has_interactive_attributes: Result of _has_interactive_attributes, if already known
             
         Returns:
-            InteractiveElement if element is interactive, None otherwise
+            InteractiveElement describing the element
         """
-        # Determine basic element type
-        element_type = self._get_element_type(element)
+        attrs = element.attrs
         
-        # Skip non-interactive elements unless they have interactive attributes
-        if (element_type not in get_interactive_element_types() and 
-            not self._has_interactive_attributes(element)):
-            return None
+        # Extract text content once; the tag index reuses already-joined subtree text
+        text_content = tag_index.text(element)
         
         # Generate unique element ID
-        element_id = self._generate_element_id(element)
+        element_id = self._generate_element_id(element, text_content, tag_index)
         
         # Generate locators
-        locators = await self._generate_locators(element, soup)
+        locators = self._generate_locators(element, soup, text_content)
         
         # Extract element properties
         properties = self._extract_element_properties(element)
-        attributes = dict(element.attrs) if element.attrs else {}
-        
-        # Determine interaction types
-        interaction_types = self._determine_interaction_types(element, element_type)
-        
-        # Generate interaction hints
-        interaction_hints = self._generate_interaction_hints(element, interaction_types)
-        
-        # Extract text content
-        text_content = self._extract_text_content(element)
-        visible_text = self._extract_visible_text(element)
-        
-        # Get form field type if applicable
-        form_field_type = self._get_form_field_type(element)
-        
-        # Determine semantic type
-        semantic_type = self._determine_semantic_type(element, text_content)
-        
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(element, element_type, semantic_type)
+        # Results outlive the tree; interned names are shared by every element
+        attributes = {intern(name): value for name, value in attrs.items()}
+        
+        # Interaction types, hints, form field type, semantic type and
+        # confidence depend only on the tag, its attributes and its text
+        (
+            interaction_mask,
+            interaction_hints,
+            form_field_type,
+            semantic_type,
+            confidence_score,
+        ) = self._classify_attributes(element, element_type, text_content, has_interactive_attributes)
+        interaction_types = [
+            interaction_type for interaction_type, bit in _INTERACTION_BITS.items()
+            if interaction_mask & bit
+        ]
+        
+        # Extract visible text
+        visible_text = self._extract_visible_text(element, text_content)
         
         # Extract accessibility information
         accessibility_info = self._extract_accessibility_info(element)
@@ -145,24 +276,23 @@ class ElementClassifier:
         # Get bounding box if available
         bounding_box = self._get_bounding_box(element)
         
-        # Determine visibility and state
-        is_visible = not self._is_hidden_element(element)
+        # Determine state
         is_enabled = not self._is_disabled_element(element)
         
         # Create InteractiveElement
         interactive_element = InteractiveElement(
             element_id=element_id,
             element_type=element_type,
-            tag_name=element.name,
+            tag_name=intern(element.name),
             locators=locators,
             properties=properties,
             attributes=attributes,
             interaction_types=interaction_types,
-            interaction_hints=interaction_hints,
+            interaction_hints=list(interaction_hints),
             text_content=text_content,
             visible_text=visible_text,
-            placeholder=element.get('placeholder'),
-            value=element.get('value'),
+            placeholder=attrs.get('placeholder'),
+            value=attrs.get('value'),
             bounding_box=bounding_box,
             is_visible=is_visible,
             is_enabled=is_enabled,
@@ -174,6 +304,52 @@ class ElementClassifier:
         
         return interactive_element
     
+    def _classify_attributes(self, element: Tag, element_type: ElementType, text_content: str,
+                             has_interactive_attributes: Optional[bool] = None) -> Tuple:
+        """
+        Classify the attribute-derived properties of an element, with caching.
+        
+        Args:
+            element: BeautifulSoup Tag element
+            element_type: Classified element type
+            text_content: Element's text content
+            has_interactive_attributes: Result of _has_interactive_attributes, if already known
+            
+        Returns:
+            Tuple of (interaction bitmask, interaction hints, form field type,
+            semantic type, confidence score)
+        """
+        cache_key = (
+            element.name,
+            element_type,
+            text_content,
+            tuple(
+                (name, value if isinstance(value, str) else tuple(value))
+                for name, value in element.attrs.items()
+            ),
+        )
+        result = self._classification_cache.get(cache_key)
+        if result is not None:
+            self._classification_cache.move_to_end(cache_key)
+            return result
+        
+        interaction_mask = self._determine_interaction_types(element, element_type)
+        semantic_type = self._determine_semantic_type(element, text_content)
+        result = (
+            interaction_mask,
+            tuple(self._generate_interaction_hints(element, interaction_mask)),
+            self._get_form_field_type(element),
+            semantic_type,
+            self._calculate_confidence_score(element, element_type, semantic_type, text_content,
+                                             has_interactive_attributes),
+        )
+        
+        self._classification_cache[cache_key] = result
+        while len(self._classification_cache) > self._max_classification_cache_size:
+            self._classification_cache.popitem(last=False)
+        
+        return result
+    
     def _get_element_type(self, element: Tag) -> ElementType:
         """
         Determine the basic element type from the HTML tag.
@@ -184,18 +360,19 @@ class ElementClassifier:
         Returns:
             ElementType enum value
         """
+        attrs = element.attrs
         tag_name = element.name.lower()
         
         # Handle input elements with specific types
         if tag_name == 'input':
-            input_type = element.get('type', 'text').lower()
-            if input_type in ['checkbox']:
+            input_type = attrs.get('type', 'text').lower()
+            if input_type == 'checkbox':
                 return ElementType.CHECKBOX
-            elif input_type in ['radio']:
+            elif input_type == 'radio':
                 return ElementType.RADIO
-            elif input_type in ['file']:
+            elif input_type == 'file':
                 return ElementType.FILE_INPUT
-            elif input_type in ['submit', 'button']:
+            elif input_type in _BUTTON_INPUT_TYPES:
                 return ElementType.SUBMIT
             else:
                 return ElementType.INPUT
@@ -213,76 +390,74 @@ class ElementClassifier:
         Returns:
             True if element has interactive attributes
         """
-        if not element.attrs:
+        attrs = element.attrs
+        if not attrs:
             return False
         
         # Check for known interactive attributes
-        for attr in self.interactive_attributes:
-            if attr in element.attrs:
-                return True
+        if attrs.keys() & self.interactive_attributes:
+            return True
         
         # Check for role attributes that indicate interactivity
-        role = element.get('role', '').lower()
-        interactive_roles = {'button', 'link', 'menuitem', 'tab', 'option', 'checkbox', 'radio'}
-        if role in interactive_roles:
+        if element.get('role', '').lower() in self._interactive_roles:
             return True
         
         # Check for CSS classes that suggest interactivity
-        css_classes = element.get('class', [])
+        css_classes = attrs.get('class', [])
         if isinstance(css_classes, str):
             css_classes = css_classes.split()
         
-        interactive_class_patterns = ['btn', 'button', 'link', 'click', 'toggle', 'submit']
-        for class_name in css_classes:
-            for pattern in interactive_class_patterns:
-                if pattern in class_name.lower():
-                    return True
-        
-        return False
+        search = self._interactive_class_re.search
+        return any(search(class_name) for class_name in css_classes)
     
-    def _generate_element_id(self, element: Tag) -> str:
+    def _generate_element_id(self, element: Tag, text_content: str, tag_index: TagIndex) -> str:
         """
         Generate a unique ID for the element.
         
         Args:
             element: BeautifulSoup Tag element
+            text_content: Element's text content
+            tag_index: Index of the element's DOM tree
             
         Returns:
             Unique element identifier
         """
+        attrs = element.attrs
+        
         # Use existing ID if available
-        if element.get('id'):
-            return f"id_{element.get('id')}"
+        dom_id = attrs.get('id')
+        if dom_id:
+            return f"id_{dom_id}"
         
         # Use name if available
-        if element.get('name'):
-            return f"name_{element.get('name')}"
+        name = attrs.get('name')
+        if name:
+            return f"name_{name}"
         
         # Generate based on tag and position
         tag_name = element.name
         
-        # Find position among siblings of same type
-        siblings = element.parent.find_all(tag_name) if element.parent else [element]
-        position = siblings.index(element) if element in siblings else 0
+        # Find position among the parent's descendants of the same type
+        position = tag_index.sibling_position(element)
         
         # Create a more descriptive ID
         base_id = f"{tag_name}_{position}"
         
         # Add distinguishing characteristics
-        if element.get('class'):
-            classes = ' '.join(element.get('class'))
+        css_classes = attrs.get('class')
+        if css_classes:
             # Use first class as part of ID
-            first_class = element.get('class')[0]
+            first_class = css_classes[0]
             base_id += f"_{first_class}"
         
-        if element.get('type'):
-            base_id += f"_{element.get('type')}"
+        input_type = attrs.get('type')
+        if input_type:
+            base_id += f"_{input_type}"
         
         # Add text content for uniqueness (truncated)
-        text = self._extract_text_content(element)
-        if text and len(text) > 3:
+        if text_content and len(text_content) > 3:
             # Use first few words
-            words = text.split()[:2]
+            words = text_content.split()[:2]
             text_part = '_'.join(words).lower()
             # Clean for ID usage
             text_part = re.sub(r'[^a-zA-Z0-9_]', '', text_part)
@@ -291,57 +466,61 @@ class ElementClassifier:
         
         return base_id[:100]  # Limit length
     
-    async def _generate_locators(self, element: Tag, soup: BeautifulSoup) -> Dict[str, str]:
+    def _generate_locators(self, element: Tag, soup: BeautifulSoup, text_content: str) -> Dict[str, str]:
         """
         Generate multiple locator strategies for the element.
         
         Args:
             element: BeautifulSoup Tag element
             soup: Full DOM tree for context
+            text_content: Element's text content
             
         Returns:
             Dictionary of locator strategies
         """
+        attrs = element.attrs
         locators = {}
         
         # ID locator
-        if element.get('id'):
-            locators['id'] = f"#{element.get('id')}"
-            locators['css'] = f"#{element.get('id')}"
-            locators['xpath'] = f"//*[@id='{element.get('id')}']"
+        dom_id = attrs.get('id')
+        if dom_id:
+            locators['id'] = f"#{dom_id}"
+            locators['css'] = f"#{dom_id}"
+            locators['xpath'] = f"//*[@id='{dom_id}']"
         
         # Name locator
-        if element.get('name'):
-            locators['name'] = element.get('name')
-            locators['css_name'] = f"[name='{element.get('name')}']"
-            locators['xpath_name'] = f"//*[@name='{element.get('name')}']"
+        name = attrs.get('name')
+        if name:
+            locators['name'] = name
+            locators['css_name'] = f"[name='{name}']"
+            locators['xpath_name'] = f"//*[@name='{name}']"
         
         # Class-based locator
-        if element.get('class'):
-            classes = '.'.join(element.get('class'))
+        css_classes = attrs.get('class')
+        if css_classes:
+            classes = '.'.join(css_classes)
             locators['css_class'] = f".{classes}"
         
         # Generate CSS selector
-        css_selector = await self.css_generator.generate_selector(element, soup)
+        css_selector = self.css_generator.generate_selector(element, soup)
         if css_selector:
             locators['css_generated'] = css_selector
         
         # Generate XPath
-        xpath = await self.xpath_generator.generate_xpath(element, soup)
+        xpath = self.xpath_generator.generate_xpath(element, soup)
         if xpath:
             locators['xpath_generated'] = xpath
         
         # Text-based locators
-        text_content = self._extract_text_content(element)
         if text_content and len(text_content.strip()) > 0:
             if element.name == 'a':
                 locators['link_text'] = text_content.strip()
-            elif element.name in ['button', 'input'] and element.get('type') in ['submit', 'button']:
+            elif element.name in _BUTTON_TEXT_TAGS and attrs.get('type') in _BUTTON_INPUT_TYPES:
                 locators['button_text'] = text_content.strip()
         
         # Attribute-based locators
-        for attr_name, attr_value in element.attrs.items():
-            if attr_name in ['data-testid', 'data-cy', 'data-test']:
+        for attr_name, attr_value in attrs.items():
+            if attr_name in _TEST_ID_ATTRIBUTES:
                 locators[f'attr_{attr_name}'] = f"[{attr_name}='{attr_value}']"
         
         return locators
@@ -356,35 +535,36 @@ class ElementClassifier:
         Returns:
             Dictionary of element properties
         """
+        attrs = element.attrs
         properties = {
             'tag_name': element.name,
-            'has_children': len(list(element.children)) > 0,
-            'is_self_closing': element.name in ['img', 'input', 'br', 'hr', 'meta', 'link'],
-            'attribute_count': len(element.attrs) if element.attrs else 0,
+            'has_children': bool(element.contents),
+            'is_self_closing': element.name in _SELF_CLOSING,
+            'attribute_count': len(attrs) if attrs else 0,
         }
         
         # Form-specific properties
         if element.name == 'input':
-            properties['input_type'] = element.get('type', 'text')
-            properties['required'] = element.has_attr('required')
-            properties['readonly'] = element.has_attr('readonly')
-            properties['multiple'] = element.has_attr('multiple')
+            properties['input_type'] = attrs.get('type', 'text')
+            properties['required'] = 'required' in attrs
+            properties['readonly'] = 'readonly' in attrs
+            properties['multiple'] = 'multiple' in attrs
         
         # Link-specific properties
         if element.name == 'a':
-            href = element.get('href', '')
+            href = attrs.get('href', '')
             properties['is_external_link'] = href.startswith('http') and 'http' in href
             properties['is_anchor_link'] = href.startswith('#')
             properties['is_mailto'] = href.startswith('mailto:')
             properties['is_tel'] = href.startswith('tel:')
         
         # Form association
-        if element.get('form'):
-            properties['associated_form'] = element.get('form')
+        if attrs.get('form'):
+            properties['associated_form'] = attrs.get('form')
         
         return properties
     
-    def _determine_interaction_types(self, element: Tag, element_type: ElementType) -> List[InteractionType]:
+    def _determine_interaction_types(self, element: Tag, element_type: ElementType) -> int:
         """
         Determine what types of interactions are possible with the element.
         
@@ -393,81 +573,80 @@ class ElementClassifier:
             element_type: Classified element type
             
         Returns:
-            List of possible interaction types
+            Bitmask of possible interaction types (see _INTERACTION_BITS)
         """
-        interactions = []
+        attrs = element.attrs
+        input_type = attrs.get('type', '').lower()
+        bits = _INTERACTION_BITS
+        interactions = 0
         
         # Click interactions
-        if element_type in [ElementType.BUTTON, ElementType.LINK, ElementType.SUBMIT]:
-            interactions.append(InteractionType.CLICK)
+        if (element_type in _CLICK_ELEMENT_TYPES or 
+            attrs.get('onclick') or attrs.get('role') == 'button'):
+            interactions |= bits[InteractionType.CLICK]
         
-        if element.get('onclick') or element.get('role') == 'button':
-            interactions.append(InteractionType.CLICK)
-        
-        # Type interactions
-        if element_type in [ElementType.INPUT, ElementType.TEXTAREA]:
-            input_type = element.get('type', 'text').lower()
-            if input_type not in ['submit', 'button', 'checkbox', 'radio', 'file']:
-                interactions.append(InteractionType.TYPE)
+        # Type interactions (a missing type reads as '', which, like 'text', is typeable)
+        if element_type in _TYPE_ELEMENT_TYPES and input_type not in _NON_TYPE_INPUT_TYPES:
+            interactions |= bits[InteractionType.TYPE]
         
         # Select interactions
         if element_type == ElementType.SELECT:
-            interactions.append(InteractionType.SELECT)
-            if element.get('multiple'):
-                interactions.append(InteractionType.MULTI_SELECT)
+            interactions |= bits[InteractionType.SELECT]
+            if attrs.get('multiple'):
+                interactions |= bits[InteractionType.MULTI_SELECT]
         
-        if element_type in [ElementType.CHECKBOX, ElementType.RADIO]:
-            interactions.append(InteractionType.SELECT)
+        if element_type in _CHOICE_ELEMENT_TYPES:
+            interactions |= bits[InteractionType.SELECT]
         
         # Special input types
-        input_type = element.get('type', '').lower()
         if input_type == 'file':
-            interactions.append(InteractionType.UPLOAD)
+            interactions |= bits[InteractionType.UPLOAD]
         elif input_type == 'range':
-            interactions.append(InteractionType.RANGE_SELECT)
+            interactions |= bits[InteractionType.RANGE_SELECT]
         elif input_type == 'color':
-            interactions.append(InteractionType.COLOR_PICK)
-        elif input_type in ['date', 'datetime-local', 'time']:
-            interactions.append(InteractionType.DATE_PICK)
+            interactions |= bits[InteractionType.COLOR_PICK]
+        elif input_type in _DATE_INPUT_TYPES:
+            interactions |= bits[InteractionType.DATE_PICK]
         
         # Hover interactions for elements with titles or complex content
-        if element.get('title') or element.name in ['abbr', 'acronym']:
-            interactions.append(InteractionType.HOVER)
+        if attrs.get('title') or element.name in _HOVER_TAGS:
+            interactions |= bits[InteractionType.HOVER]
         
         # Focus interactions for form elements
-        if element.name in ['input', 'textarea', 'select', 'button']:
-            interactions.append(InteractionType.FOCUS)
-            interactions.append(InteractionType.BLUR)
+        if element.name in _FOCUSABLE_TAGS:
+            interactions |= bits[InteractionType.FOCUS]
+            interactions |= bits[InteractionType.BLUR]
         
         # Submit interactions for forms
-        if element.name == 'form' or (element.name == 'input' and element.get('type') == 'submit'):
-            interactions.append(InteractionType.SUBMIT)
+        if element.name == 'form' or (element.name == 'input' and attrs.get('type') == 'submit'):
+            interactions |= bits[InteractionType.SUBMIT]
         
         # Navigation for links
-        if element.name == 'a' and element.get('href'):
-            interactions.append(InteractionType.NAVIGATE)
+        if element.name == 'a' and attrs.get('href'):
+            interactions |= bits[InteractionType.NAVIGATE]
         
         return interactions
     
-    def _generate_interaction_hints(self, element: Tag, interaction_types: List[InteractionType]) -> List[str]:
+    def _generate_interaction_hints(self, element: Tag, interaction_types: int) -> List[str]:
         """
         Generate hints for how to interact with the element.
         
         Args:
             element: BeautifulSoup Tag element
-            interaction_types: List of possible interactions
+            interaction_types: Bitmask of possible interactions
             
         Returns:
             List of interaction hints
         """
+        attrs = element.attrs
         hints = []
         
         # Click hints
-        if InteractionType.CLICK in interaction_types:
+        if interaction_types & _INTERACTION_BITS[InteractionType.CLICK]:
             if element.name == 'button':
                 hints.append("Click to activate button")
             elif element.name == 'a':
-                href = element.get('href', '')
+                href = attrs.get('href', '')
                 if href.startswith('#'):
                     hints.append("Click to navigate to page section")
                 elif href.startswith('mailto:'):
@@ -480,9 +659,9 @@ class ElementClassifier:
                 hints.append("Element is clickable")
         
         # Type hints
-        if InteractionType.TYPE in interaction_types:
-            input_type = element.get('type', 'text').lower()
-            placeholder = element.get('placeholder', '')
+        if interaction_types & _INTERACTION_BITS[InteractionType.TYPE]:
+            input_type = attrs.get('type', 'text').lower()
+            placeholder = attrs.get('placeholder', '')
             
             if input_type == 'email':
                 hints.append("Enter email address")
@@ -498,20 +677,20 @@ class ElementClassifier:
                 hints.append("Enter text")
         
         # Select hints
-        if InteractionType.SELECT in interaction_types:
+        if interaction_types & _INTERACTION_BITS[InteractionType.SELECT]:
             if element.name == 'select':
-                if element.get('multiple'):
+                if attrs.get('multiple'):
                     hints.append("Select one or more options")
                 else:
                     hints.append("Select an option")
-            elif element.get('type') == 'checkbox':
+            elif attrs.get('type') == 'checkbox':
                 hints.append("Check or uncheck")
-            elif element.get('type') == 'radio':
+            elif attrs.get('type') == 'radio':
                 hints.append("Select radio option")
         
         # Upload hints
-        if InteractionType.UPLOAD in interaction_types:
-            accept = element.get('accept', '')
+        if interaction_types & _INTERACTION_BITS[InteractionType.UPLOAD]:
+            accept = attrs.get('accept', '')
             if 'image' in accept:
                 hints.append("Upload image file")
             elif accept:
@@ -521,30 +700,19 @@ class ElementClassifier:
         
         return hints
     
-    def _extract_text_content(self, element: Tag) -> str:
-        """
-        Extract all text content from the element.
-        
-        Args:
-            element: BeautifulSoup Tag element
-            
-        Returns:
-            Text content as string
-        """
-        return element.get_text(strip=True)
-    
-    def _extract_visible_text(self, element: Tag) -> str:
+    def _extract_visible_text(self, element: Tag, text_content: str) -> str:
         """
         Extract only visible text content.
         
         Args:
             element: BeautifulSoup Tag element
+            text_content: Element's text content
             
         Returns:
             Visible text content as string
         """
         # For now, same as text content - could be enhanced to check CSS visibility
-        return self._extract_text_content(element)
+        return text_content
     
     def _get_form_field_type(self, element: Tag) -> Optional[FormFieldType]:
         """
@@ -556,13 +724,14 @@ class ElementClassifier:
         Returns:
             FormFieldType if applicable, None otherwise
         """
+        attrs = element.attrs
         if element.name == 'input':
-            input_type = element.get('type', 'text').lower()
+            input_type = attrs.get('type', 'text').lower()
             return INPUT_TYPE_TO_FORM_FIELD_TYPE.get(input_type)
         elif element.name == 'textarea':
             return FormFieldType.TEXTAREA
         elif element.name == 'select':
-            if element.get('multiple'):
+            if attrs.get('multiple'):
                 return FormFieldType.MULTISELECT
             else:
                 return FormFieldType.SELECT
@@ -582,38 +751,40 @@ class ElementClassifier:
         Returns:
             SemanticType if determinable, None otherwise
         """
+        attrs = element.attrs
+        
         # Check element attributes for semantic hints
-        element_id = element.get('id', '').lower()
-        element_classes = ' '.join(element.get('class', [])).lower()
+        element_id = attrs.get('id', '').lower()
+        element_classes = ' '.join(attrs.get('class', [])).lower()
         text_lower = text_content.lower()
         
         # Search forms
-        search_indicators = ['search', 'query', 'find']
-        if any(indicator in element_id or indicator in element_classes or indicator in text_lower 
-               for indicator in search_indicators):
+        search = _SEARCH_INDICATORS.search
+        if search(element_id) or search(element_classes) or search(text_lower):
             return SemanticType.SEARCH_FORM
         
         # Login forms
-        login_indicators = ['login', 'signin', 'sign-in', 'auth', 'user']
-        if any(indicator in element_id or indicator in element_classes or indicator in text_lower 
-               for indicator in login_indicators):
+        search = _LOGIN_INDICATORS.search
+        if search(element_id) or search(element_classes) or search(text_lower):
             return SemanticType.LOGIN_FORM
         
         # Navigation elements
-        nav_indicators = ['nav', 'menu', 'header', 'breadcrumb']
-        if (element.name == 'nav' or 
-            any(indicator in element_id or indicator in element_classes 
-                for indicator in nav_indicators)):
+        search = _NAV_INDICATORS.search
+        if element.name == 'nav' or search(element_id) or search(element_classes):
             return SemanticType.PRIMARY_NAV
         
-        # Check for specific patterns in text
-        for semantic_type, patterns in self.semantic_patterns.items():
-            if any(pattern in text_lower for pattern in patterns):
+        # Check for specific patterns in text, in priority order
+        if not text_lower:
+            return None
+        contains = text_lower.__contains__
+        for semantic_type, patterns in self._semantic_pattern_groups:
+            if any(map(contains, patterns)):
                 return semantic_type
         
         return None
     
-    def _calculate_confidence_score(self, element: Tag, element_type: ElementType, semantic_type: Optional[SemanticType]) -> float:
+    def _calculate_confidence_score(self, element: Tag, element_type: ElementType, semantic_type: Optional[SemanticType],
+                                    text_content: str, has_interactive_attributes: Optional[bool] = None) -> float:
         """
         Calculate confidence score for element classification.
         
@@ -621,14 +792,17 @@ class ElementClassifier:
             element: BeautifulSoup Tag element
             element_type: Classified element type
             semantic_type: Classified semantic type
+            text_content: Element's text content
+            has_interactive_attributes: Result of _has_interactive_attributes, if already known
             
         Returns:
             Confidence score between 0.0 and 1.0
         """
+        attrs = element.attrs
         score = 0.5  # Base score
         
         # Higher confidence for standard interactive elements
-        if element_type in get_interactive_element_types():
+        if element_type in _INTERACTIVE_ELEMENT_TYPES:
             score += 0.3
         
         # Higher confidence if semantic type was determined
@@ -636,17 +810,19 @@ class ElementClassifier:
             score += 0.2
         
         # Higher confidence for elements with clear attributes
-        if element.get('id') or element.get('name'):
+        if attrs.get('id') or attrs.get('name'):
             score += 0.1
         
         # Higher confidence for elements with descriptive text
-        text_content = self._extract_text_content(element)
         if text_content and len(text_content.strip()) > self.min_text_length:
             score += 0.1
         
         # Lower confidence for generic divs/spans without clear indicators
-        if element.name in ['div', 'span'] and not self._has_interactive_attributes(element):
-            score -= 0.2
+        if element.name in _GENERIC_CONTAINER_TAGS:
+            if has_interactive_attributes is None:
+                has_interactive_attributes = self._has_interactive_attributes(element)
+            if not has_interactive_attributes:
+                score -= 0.2
         
         return min(max(score, 0.0), 1.0)
     
@@ -660,56 +836,52 @@ class ElementClassifier:
         Returns:
             AccessibilityInfo object
         """
+        attrs = element.attrs
         accessibility_info = AccessibilityInfo()
         
         # Extract ARIA attributes
-        for attr_name, attr_value in element.attrs.items():
-            if attr_name.startswith('aria-'):
-                aria_name = attr_name[5:]  # Remove 'aria-' prefix
-                
-                if aria_name == 'label':
-                    accessibility_info.label = attr_value
-                elif aria_name == 'describedby':
-                    accessibility_info.described_by = attr_value.split()
-                elif aria_name == 'labelledby':
-                    accessibility_info.labelled_by = attr_value.split()
-                elif aria_name == 'hidden':
-                    accessibility_info.hidden = attr_value.lower() == 'true'
-                elif aria_name == 'disabled':
-                    accessibility_info.disabled = attr_value.lower() == 'true'
-                elif aria_name == 'required':
-                    accessibility_info.required = attr_value.lower() == 'true'
-                elif aria_name == 'invalid':
-                    accessibility_info.invalid = attr_value.lower() == 'true'
-                elif aria_name == 'expanded':
-                    accessibility_info.expanded = attr_value.lower() == 'true'
-                elif aria_name == 'checked':
-                    accessibility_info.checked = attr_value.lower() == 'true'
-                else:
-                    accessibility_info.attributes[attr_name] = attr_value
+        for attr_name, attr_value in attrs.items():
+            if attr_name[:5] != 'aria-':
+                continue
+            aria_name = attr_name[5:]  # Remove 'aria-' prefix
+            
+            if aria_name == 'label':
+                accessibility_info.label = attr_value
+                continue
+            
+            field_name = self._ARIA_LIST_FIELDS.get(aria_name)
+            if field_name is not None:
+                setattr(accessibility_info, field_name, attr_value.split())
+                continue
+            
+            field_name = self._ARIA_BOOL_FIELDS.get(aria_name)
+            if field_name is not None:
+                setattr(accessibility_info, field_name, attr_value.lower() == 'true')
+            else:
+                accessibility_info.attributes[attr_name] = attr_value
         
         # Extract role
-        role = element.get('role')
+        role = attrs.get('role')
         if role:
             # Convert string role to AccessibilityRole enum if possible
-            try:
-                from ..types.element_data_types import AccessibilityRole
-                accessibility_info.role = AccessibilityRole(role.upper())
-            except (ValueError, ImportError):
+            role_enum = ARIA_ROLE_TO_ACCESSIBILITY_ROLE.get(role.lower())
+            if role_enum is not None:
+                accessibility_info.role = role_enum
+            else:
                 accessibility_info.attributes['role'] = role
         
         # Extract other accessibility-related attributes
-        if element.has_attr('disabled'):
+        if 'disabled' in attrs:
             accessibility_info.disabled = True
         
-        if element.has_attr('required'):
+        if 'required' in attrs:
             accessibility_info.required = True
         
         # Check for associated label
-        if element.get('id'):
+        if attrs.get('id'):
             # Note: This would require access to the full DOM to find labels
             # For now, just mark that we should look for labels
-            accessibility_info.attributes['has_id'] = element.get('id')
+            accessibility_info.attributes['has_id'] = attrs.get('id')
         
         return accessibility_info
     
@@ -737,23 +909,22 @@ class ElementClassifier:
         Returns:
             True if element appears to be hidden
         """
+        attrs = element.attrs
+        
         # Check common hiding attributes
-        if element.get('hidden') is not None:
+        if attrs.get('hidden') is not None:
             return True
         
-        if element.get('aria-hidden') == 'true':
+        if attrs.get('aria-hidden') == 'true':
             return True
         
         # Check style attribute for visibility/display
-        style = element.get('style', '')
-        if style:
-            style_lower = style.lower()
-            if ('display:none' in style_lower.replace(' ', '') or 
-                'visibility:hidden' in style_lower.replace(' ', '')):
-                return True
+        style = attrs.get('style')
+        if style and _HIDDEN_STYLE_RE.search(style):
+            return True
         
         # Check input type hidden
-        if element.name == 'input' and element.get('type') == 'hidden':
+        if element.name == 'input' and attrs.get('type') == 'hidden':
             return True
         
         return False
@@ -768,10 +939,11 @@ class ElementClassifier:
         Returns:
             True if element is disabled
         """
-        return (element.has_attr('disabled') or 
-                element.get('aria-disabled') == 'true')
+        attrs = element.attrs
+        return ('disabled' in attrs or 
+                attrs.get('aria-disabled') == 'true')
     
-    async def _build_element_relationships(self, interactive_elements: List[InteractiveElement], soup: BeautifulSoup) -> None:
+    def _build_element_relationships(self, interactive_elements: List[InteractiveElement], soup: BeautifulSoup) -> None:
         """
         Build hierarchical relationships between elements.
         
@@ -788,6 +960,15 @@ class ElementClassifier:
             if dom_element:
                 element_map[elem.element_id] = (elem, dom_element)
         
+        # Reverse lookup by identity; element_map keeps the Tags alive, so
+        # their ids stay valid. The first element mapped to a Tag wins.
+        dom_to_interactive: Dict[int, InteractiveElement] = {}
+        for interactive_elem, dom_elem in element_map.values():
+            dom_to_interactive.setdefault(id(dom_elem), interactive_elem)
+        
+        children_map = self._collect_interactive_descendants(soup, element_map, dom_to_interactive)
+        depth_cache: Dict[int, int] = {}
+        
         # Build relationships
         for element_id, (interactive_elem, dom_elem) in element_map.items():
             hierarchy = ElementHierarchy()
@@ -795,26 +976,81 @@ class ElementClassifier:
             # Find parent
             parent_elem = dom_elem.parent
             if parent_elem:
-                parent_interactive = self._find_interactive_element_for_dom(parent_elem, element_map)
+                parent_interactive = self._find_interactive_element_for_dom(parent_elem, dom_to_interactive)
                 if parent_interactive:
                     hierarchy.parent = parent_interactive.element_id
             
             # Find children
-            for child in dom_elem.find_all():
-                child_interactive = self._find_interactive_element_for_dom(child, element_map)
-                if child_interactive and child_interactive.element_id != element_id:
-                    hierarchy.children.append(child_interactive.element_id)
+            hierarchy.children = list(children_map[id(dom_elem)])
             
             # Calculate depth
-            depth = 0
-            current = dom_elem
-            while current.parent:
-                depth += 1
-                current = current.parent
-            hierarchy.depth = depth
+            hierarchy.depth = self._element_depth(dom_elem, depth_cache)
             
             interactive_elem.hierarchy = hierarchy
     
+    def _collect_interactive_descendants(self, soup: BeautifulSoup, element_map: Dict[str, Tuple[InteractiveElement, Tag]],
+                                         dom_to_interactive: Dict[int, InteractiveElement]) -> Dict[int, List[str]]:
+        """
+        Collect the interactive descendants of every interactive element.
+        
+        Interactive elements are laid out once in document order. A subtree
+        covers a contiguous run of document positions, so each element's
+        descendants are one slice of that shared order, found by bisection,
+        and no subtree is walked.
+        
+        Args:
+            soup: Full DOM tree
+            element_map: Mapping of element IDs to (InteractiveElement, Tag) tuples
+            dom_to_interactive: Mapping of id(Tag) to its InteractiveElement
+            
+        Returns:
+            Mapping of id(Tag) to the element IDs of its interactive
+            descendants, in document order
+        """
+        tag_index = get_tag_index(soup)
+        ranges = {id(dom_elem): tag_index.subtree_range(dom_elem)
+                  for _, dom_elem in element_map.values()}
+        
+        ordered = sorted((start, tag_id) for tag_id, (start, _) in ranges.items())
+        positions = [start for start, _ in ordered]
+        element_ids = [dom_to_interactive[tag_id].element_id for _, tag_id in ordered]
+        
+        return {
+            tag_id: element_ids[bisect_right(positions, start):bisect_right(positions, end)]
+            for tag_id, (start, end) in ranges.items()
+        }
+    
+    def _element_depth(self, element: Tag, depth_cache: Dict[int, int]) -> int:
+        """
+        Count an element's ancestors, reusing depths already worked out.
+        
+        Only the ancestors missing from the cache are walked, and each of
+        them is cached on the way back down, so shared ancestors are
+        visited once however many elements sit below them.
+        
+        Args:
+            element: BeautifulSoup Tag element
+            depth_cache: Mapping of id(Tag) to depth, shared across calls
+            
+        Returns:
+            Number of ancestors of the element
+        """
+        uncached = []
+        current = element
+        depth = -1
+        while current is not None:
+            cached = depth_cache.get(id(current))
+            if cached is not None:
+                depth = cached
+                break
+            uncached.append(current)
+            current = current.parent
+        
+        for tag in reversed(uncached):
+            depth += 1
+            depth_cache[id(tag)] = depth
+        return depth
+    
     def _find_dom_element_by_locators(self, locators: Dict[str, str], soup: BeautifulSoup) -> Optional[Tag]:
         """
         Find DOM element using its locators.
@@ -826,14 +1062,16 @@ class ElementClassifier:
         Returns:
             Found Tag element or None
         """
+        tag_index = get_tag_index(soup)
+        
         # Try ID first
         if 'id' in locators:
             element_id = locators['id'].replace('#', '')
-            return soup.find(id=element_id)
+            return tag_index.find_by_attribute('id', element_id)
         
         # Try name
         if 'name' in locators:
-            return soup.find(attrs={'name': locators['name']})
+            return tag_index.find_by_attribute('name', locators['name'])
         
         # Try CSS selector
         if 'css' in locators:
@@ -844,38 +1082,70 @@ class ElementClassifier:
         
         return None
     
-    def _find_interactive_element_for_dom(self, dom_elem: Tag, element_map: Dict) -> Optional[InteractiveElement]:
+    def _find_interactive_element_for_dom(self, dom_elem: Tag,
+                                          dom_to_interactive: Dict[int, InteractiveElement]) -> Optional[InteractiveElement]:
         """
         Find the interactive element that corresponds to a DOM element.
         
         Args:
             dom_elem: BeautifulSoup Tag element
-            element_map: Mapping of element IDs to (InteractiveElement, Tag) tuples
+            dom_to_interactive: Mapping of id(Tag) to its InteractiveElement
             
         Returns:
             Corresponding InteractiveElement or None
         """
-        for element_id, (interactive_elem, mapped_dom_elem) in element_map.items():
-            if dom_elem == mapped_dom_elem:
-                return interactive_elem
-        return None
+        return dom_to_interactive.get(id(dom_elem))
     
-    def _load_semantic_patterns(self) -> Dict[SemanticType, List[str]]:
+    def _get_semantic_pattern_groups(self) -> Tuple[Tuple[SemanticType, Tuple[str, ...]], ...]:
+        """
+        Get the pruned pattern groups for the current semantic_patterns.
+        
+        The patterns are frozen on every call, so edits to semantic_patterns
+        are seen; the pruning itself is cached per distinct table.
+        
+        Returns:
+            Semantic types with their text patterns, in priority order
+        """
+        return self._group_semantic_patterns(tuple(
+            (semantic_type, tuple(patterns))
+            for semantic_type, patterns in self.semantic_patterns.items()
+        ))
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _group_semantic_patterns(
+        semantic_patterns: Tuple[Tuple[SemanticType, Tuple[str, ...]], ...]
+    ) -> Tuple[Tuple[SemanticType, Tuple[str, ...]], ...]:
+        """
+        Prune frozen (type, patterns) tuples for matching.
+        
+        A pattern that contains a pattern of the same or a higher-priority
+        type can never decide the result (the shorter one always matches
+        first), so it is left out and each text is scanned fewer times.
+        
+        Args:
+            semantic_patterns: Semantic types with their text patterns, in priority order
+            
+        Returns:
+            Semantic types with their pruned text patterns, in priority order
+        """
+        groups = []
+        seen: List[str] = []
+        for semantic_type, patterns in semantic_patterns:
+            seen.extend(patterns)
+            kept = tuple(
+                pattern for pattern in patterns
+                if not any(other != pattern and other in pattern for other in seen)
+            )
+            groups.append((semantic_type, kept))
+        return tuple(groups)
+    
+    @classmethod
+    def _load_semantic_patterns(cls) -> Mapping[SemanticType, Tuple[str, ...]]:
         """
         Load semantic classification patterns.
         
         Returns:
-            Dictionary mapping semantic types to text patterns
+            Read-only mapping of semantic types to default text patterns
         """
-        return {
-            SemanticType.SEARCH_FORM: ['search', 'find', 'query', 'lookup'],
-            SemanticType.LOGIN_FORM: ['login', 'sign in', 'log in', 'signin', 'authenticate'],
-            SemanticType.REGISTRATION_FORM: ['register', 'sign up', 'signup', 'create account'],
-            SemanticType.CONTACT_FORM: ['contact', 'message', 'feedback', 'inquiry'],
-            SemanticType.CHECKOUT_FORM: ['checkout', 'payment', 'billing', 'purchase'],
-            SemanticType.CART: ['cart', 'basket', 'bag', 'shopping'],
-            SemanticType.WISHLIST: ['wishlist', 'favorites', 'saved', 'bookmark'],
-            SemanticType.SOCIAL_MEDIA: ['share', 'like', 'follow', 'tweet', 'facebook', 'twitter'],
-            SemanticType.ADVERTISEMENT: ['ad', 'advertisement', 'sponsor', 'promoted'],
-            SemanticType.COOKIE_BANNER: ['cookie', 'privacy', 'accept', 'consent'],
-        }
\ No newline at end of file
+        return _SEMANTIC_PATTERNS
\ No newline at end of file
@@ -17,6 +17,7 @@ from ..types.dom_data_types import (
 from ..types.element_data_types import (
     SemanticType, ElementType
 )
+from ..utils.tag_index import analysis_scoped, get_tag_index
 
 
 class SemanticExtractor:
@@ -31,40 +32,46 @@ class SemanticExtractor:
         """Initialize Semantic Extractor."""
         self.config = config or {}
     
+    @analysis_scoped
     async def extract_semantic_blocks(self, soup: BeautifulSoup) -> List[SemanticBlock]:
         """Extract semantically meaningful content blocks."""
         blocks = []
         
         # Find semantic HTML5 elements
-        semantic_elements = soup.find_all(['article', 'section', 'aside', 'main', 'header', 'footer'])
+        tag_index = get_tag_index(soup)
+        semantic_elements = tag_index.find_all(['article', 'section', 'aside', 'main', 'header', 'footer'])
         
         for idx, element in enumerate(semantic_elements):
             semantic_type = self._determine_semantic_type_from_tag(element.name)
+            # Memoized on the index, so nested blocks share their subtrees' text
+            text = tag_index.text(element)
             
             block = SemanticBlock(
                 block_id=f"semantic_block_{idx}",
                 semantic_type=semantic_type,
                 element_ids=[f"elem_{idx}"],
-                text_content=element.get_text(strip=True)[:200],  # Truncate
-                importance_score=self._calculate_importance_score(element)
+                text_content=text[:200],  # Truncate
+                importance_score=self._calculate_importance_score(element, len(text))
             )
             blocks.append(block)
         
         return blocks
     
+    @analysis_scoped
     async def extract_navigation_structure(self, soup: BeautifulSoup) -> NavigationStructure:
         """Extract navigation structure from the page."""
         nav_structure = NavigationStructure()
         
         # Find navigation elements
-        nav_elements = soup.find_all('nav')
+        tag_index = get_tag_index(soup)
+        nav_elements = tag_index.find_all('nav')
         
         if nav_elements:
             # Assume first nav is primary
             primary_nav = NavigationArea(
                 nav_id="primary_nav",
                 nav_type=SemanticType.PRIMARY_NAV,
-                links=[f"link_{i}" for i in range(len(nav_elements[0].find_all('a')))]
+                links=[f"link_{i}" for i in range(tag_index.count_within(nav_elements[0], 'a'))]
             )
             nav_structure.primary_navigation = primary_nav
         
@@ -82,7 +89,7 @@ class SemanticExtractor:
         }
         return mapping.get(tag_name, SemanticType.UNKNOWN)
     
-    def _calculate_importance_score(self, element: Tag) -> float:
+    def _calculate_importance_score(self, element: Tag, text_length: int) -> float:
         """Calculate importance score for a semantic block."""
         score = 0.5
         
@@ -91,7 +98,6 @@ class SemanticExtractor:
             score += 0.3
         
         # Boost for text content
-        text_length = len(element.get_text(strip=True))
         if text_length > 100:
             score += 0.2
         
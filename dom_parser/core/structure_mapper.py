@@ -5,7 +5,10 @@ Maps the overall structure of the page, identifies layout patterns,
 and builds hierarchical relationships between elements.
 """
 
+import asyncio
+import re
 from typing import Dict, Any, Optional, List
+import soupsieve
 from bs4 import BeautifulSoup, Tag
 
 from ..types.dom_data_types import (
@@ -13,6 +16,19 @@ from ..types.dom_data_types import (
     SidebarArea, HeaderFooterInfo
 )
 from ..types.element_data_types import SemanticType
+from ..utils.tag_index import TagIndex, analysis_scoped, get_tag_index
+
+
+# Sectioning elements reported as page sections, and the subset that holds
+# the main content
+_SECTION_TAGS = ('section', 'article', 'main', 'aside')
+_CONTENT_TAGS = frozenset({'main', 'article'})
+
+# Searched case-insensitively in place, without lowercasing the footer text
+_COPYRIGHT_RE = re.compile('©|copyright', re.IGNORECASE)
+
+# Header logo candidates, compiled once rather than parsed per page
+_LOGO_SELECTOR = soupsieve.compile('img, .logo, #logo')
 
 
 class StructureMapper:
@@ -27,45 +43,44 @@ class StructureMapper:
         """Initialize Structure Mapper."""
         self.config = config or {}
     
+    @analysis_scoped
     async def map_page_structure(self, soup: BeautifulSoup) -> PageStructure:
         """Map the overall structure of the page."""
         page_structure = PageStructure()
         
-        # Identify major sections
-        sections = await self._identify_page_sections(soup)
-        page_structure.sections = sections
-        
-        # Identify navigation areas
-        nav_areas = await self._identify_navigation_areas(soup)
-        page_structure.navigation_areas = nav_areas
-        
-        # Identify content areas
-        content_areas = await self._identify_content_areas(soup)
-        page_structure.content_areas = content_areas
-        
-        # Identify sidebar areas
-        sidebar_areas = await self._identify_sidebar_areas(soup)
-        page_structure.sidebar_areas = sidebar_areas
-        
-        # Identify header and footer
-        header_footer = await self._identify_header_footer(soup)
-        page_structure.header_footer = header_footer
+        # Every step reads the same tag buckets; sectioning elements are
+        # merged into document order once and shared by sections and content
+        tag_index = get_tag_index(soup)
+        section_elements = tag_index.find_all(_SECTION_TAGS)
+        
+        # The areas are independent of one another, so schedule them together:
+        # major sections, navigation, content, sidebars, header and footer
+        (
+            page_structure.sections,
+            page_structure.navigation_areas,
+            page_structure.content_areas,
+            page_structure.sidebar_areas,
+            page_structure.header_footer,
+        ) = await asyncio.gather(
+            self._identify_page_sections(section_elements, tag_index),
+            self._identify_navigation_areas(tag_index),
+            self._identify_content_areas(section_elements, tag_index),
+            self._identify_sidebar_areas(tag_index),
+            self._identify_header_footer(tag_index),
+        )
         
         # Determine layout type
-        page_structure.layout_type = self._determine_layout_type(soup)
+        page_structure.layout_type = self._determine_layout_type(tag_index)
         
         # Build heading structure
-        page_structure.heading_structure = self._build_heading_structure(soup)
+        page_structure.heading_structure = self._build_heading_structure(tag_index)
         
         return page_structure
     
-    async def _identify_page_sections(self, soup: BeautifulSoup) -> List[PageSection]:
+    async def _identify_page_sections(self, section_elements: List[Tag], tag_index: TagIndex) -> List[PageSection]:
         """Identify major page sections."""
         sections = []
         
-        # Find semantic section elements
-        section_elements = soup.find_all(['section', 'article', 'main', 'aside'])
-        
         for idx, element in enumerate(section_elements):
             section_type = self._get_section_semantic_type(element)
             
@@ -73,85 +88,86 @@ class StructureMapper:
                 section_id=f"section_{idx}",
                 section_type=section_type,
                 element_ids=[f"elem_{idx}"],
-                heading=self._extract_section_heading(element)
+                heading=self._extract_section_heading(element, tag_index)
             )
             sections.append(section)
         
         return sections
     
-    async def _identify_navigation_areas(self, soup: BeautifulSoup) -> List[NavigationArea]:
+    async def _identify_navigation_areas(self, tag_index: TagIndex) -> List[NavigationArea]:
         """Identify navigation areas."""
         nav_areas = []
         
-        nav_elements = soup.find_all('nav')
+        nav_elements = tag_index.find_all('nav')
         for idx, nav_element in enumerate(nav_elements):
             nav_area = NavigationArea(
                 nav_id=f"nav_{idx}",
                 nav_type=SemanticType.PRIMARY_NAV if idx == 0 else SemanticType.SECONDARY_NAV,
-                links=[f"link_{i}" for i in range(len(nav_element.find_all('a')))]
+                links=[f"link_{i}" for i in range(tag_index.count_within(nav_element, 'a'))]
             )
             nav_areas.append(nav_area)
         
         return nav_areas
     
-    async def _identify_content_areas(self, soup: BeautifulSoup) -> List[ContentArea]:
+    async def _identify_content_areas(self, section_elements: List[Tag], tag_index: TagIndex) -> List[ContentArea]:
         """Identify main content areas."""
         content_areas = []
         
         # Look for main content elements
-        content_elements = soup.find_all(['main', 'article'])
+        content_elements = [element for element in section_elements
+                            if element.name in _CONTENT_TAGS]
         
         for idx, element in enumerate(content_elements):
             content_area = ContentArea(
                 content_id=f"content_{idx}",
                 content_type=SemanticType.MAIN_CONTENT,
-                headings=[f"heading_{i}" for i in range(len(element.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])))],
-                paragraphs=[f"para_{i}" for i in range(len(element.find_all('p')))],
-                word_count=len(element.get_text(strip=True).split())
+                headings=[f"heading_{i}" for i in range(tag_index.count_within(element, ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']))],
+                paragraphs=[f"para_{i}" for i in range(tag_index.count_within(element, 'p'))],
+                word_count=len(tag_index.text(element).split())
             )
             content_areas.append(content_area)
         
         return content_areas
     
-    async def _identify_sidebar_areas(self, soup: BeautifulSoup) -> List[SidebarArea]:
+    async def _identify_sidebar_areas(self, tag_index: TagIndex) -> List[SidebarArea]:
         """Identify sidebar areas."""
         sidebar_areas = []
         
-        aside_elements = soup.find_all('aside')
+        aside_elements = tag_index.find_all('aside')
         for idx, element in enumerate(aside_elements):
             sidebar = SidebarArea(
                 sidebar_id=f"sidebar_{idx}",
                 position="right",  # Default position
-                widgets=[f"widget_{i}" for i in range(len(element.find_all(['div', 'section'])))]
+                widgets=[f"widget_{i}" for i in range(tag_index.count_within(element, ['div', 'section']))]
             )
             sidebar_areas.append(sidebar)
         
         return sidebar_areas
     
-    async def _identify_header_footer(self, soup: BeautifulSoup) -> HeaderFooterInfo:
+    async def _identify_header_footer(self, tag_index: TagIndex) -> HeaderFooterInfo:
         """Identify header and footer information."""
         header_footer = HeaderFooterInfo()
         
         # Find header
-        header_element = soup.find('header')
+        header_element = tag_index.find('header')
         if header_element:
             header_footer.header_id = "main_header"
             header_footer.header_elements = ["header_elem_0"]
             
             # Look for logo
-            logo_element = header_element.find(['img', '.logo', '#logo'])
+            logo_element = _LOGO_SELECTOR.select_one(header_element)
             if logo_element:
                 header_footer.logo = "logo_elem"
         
         # Find footer
-        footer_element = soup.find('footer')
+        footer_element = tag_index.find('footer')
         if footer_element:
             header_footer.footer_id = "main_footer"
             header_footer.footer_elements = ["footer_elem_0"]
             
             # Look for copyright
             copyright_text = footer_element.get_text()
-            if '©' in copyright_text or 'copyright' in copyright_text.lower():
+            if _COPYRIGHT_RE.search(copyright_text):
                 header_footer.copyright = copyright_text.strip()[:100]
         
         return header_footer
@@ -171,19 +187,19 @@ class StructureMapper:
         
         return SemanticType.UNKNOWN
     
-    def _extract_section_heading(self, element: Tag) -> Optional[str]:
+    def _extract_section_heading(self, element: Tag, tag_index: TagIndex) -> Optional[str]:
         """Extract the main heading from a section."""
-        heading = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        if heading:
-            return heading.get_text(strip=True)
+        headings = tag_index.find_all_within(element, ['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        if headings:
+            return tag_index.text(headings[0])
         return None
     
-    def _determine_layout_type(self, soup: BeautifulSoup) -> str:
+    def _determine_layout_type(self, tag_index: TagIndex) -> str:
         """Determine the overall layout type of the page."""
         # Simple heuristics for layout detection
-        has_main = bool(soup.find('main'))
-        has_aside = bool(soup.find('aside'))
-        has_nav = bool(soup.find('nav'))
+        has_main = 'main' in tag_index.by_tag
+        has_aside = 'aside' in tag_index.by_tag
+        has_nav = 'nav' in tag_index.by_tag
         
         if has_main and has_aside:
             return "two_column"
@@ -194,17 +210,17 @@ class StructureMapper:
         else:
             return "unknown"
     
-    def _build_heading_structure(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _build_heading_structure(self, tag_index: TagIndex) -> List[Dict[str, Any]]:
         """Build hierarchical heading structure."""
         headings = []
-        heading_elements = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        heading_elements = tag_index.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
         
         for idx, heading in enumerate(heading_elements):
             level = int(heading.name[1])  # Extract number from h1, h2, etc.
             headings.append({
                 'id': f"heading_{idx}",
                 'level': level,
-                'text': heading.get_text(strip=True),
+                'text': tag_index.text(heading),
                 'tag': heading.name
             })
         
@@ -9,7 +9,8 @@ from .element_data_types import (
     FormFieldType, AccessibilityRole,
     get_interactive_element_types, get_content_element_types,
     get_structural_element_types, get_form_field_types,
-    HTML_TAG_TO_ELEMENT_TYPE, INPUT_TYPE_TO_FORM_FIELD_TYPE
+    HTML_TAG_TO_ELEMENT_TYPE, INPUT_TYPE_TO_FORM_FIELD_TYPE,
+    ARIA_ROLE_TO_ACCESSIBILITY_ROLE
 )
 
 __all__ = [
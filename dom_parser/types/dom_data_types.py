@@ -5,15 +5,26 @@ Defines the main data structures used throughout the DOM analysis process,
 including results, elements, page structure, and semantic information.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, FrozenSet
 from datetime import datetime
 from enum import Enum
 
 from .element_data_types import ElementType, InteractionType, SemanticType, FormFieldType, AccessibilityRole
 
+# Result types are created per element, form and section on every page, so
+# they use __slots__ where dataclasses support it (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Element types reported by DOMAnalysisResult.get_form_fields
+_FORM_FIELD_ELEMENT_TYPES = frozenset({
+    ElementType.INPUT, ElementType.TEXTAREA, ElementType.SELECT,
+    ElementType.CHECKBOX, ElementType.RADIO,
+})
+
+
+@dataclass(**_SLOTS)
 class AccessibilityInfo:
     """Accessibility information for an element or page."""
     
@@ -41,7 +52,7 @@ class AccessibilityInfo:
     attributes: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ElementHierarchy:
     """Hierarchical information about an element."""
     
@@ -54,7 +65,7 @@ class ElementHierarchy:
     index_in_parent: int = 0  # Position among siblings
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class InteractiveElement:
     """Represents an interactive element on the page."""
     
@@ -101,9 +112,33 @@ class InteractiveElement:
     
     # Additional metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    # Tokenized text_content, cached as (text, words, word_count)
+    _text_features: Optional[Tuple[str, FrozenSet[str], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def text_tokens(self) -> FrozenSet[str]:
+        """Lowercased set of words in the text content."""
+        return self._tokenize_text()[1]
+    
+    @property
+    def text_word_count(self) -> int:
+        """Number of words in the text content."""
+        return self._tokenize_text()[2]
+    
+    def _tokenize_text(self) -> Tuple[str, FrozenSet[str], int]:
+        """Tokenize text_content once, re-tokenizing only if it was reassigned."""
+        features = self._text_features
+        if features is None or features[0] is not self.text_content:
+            words = self.text_content.split()
+            features = (self.text_content, frozenset(word.lower() for word in words), len(words))
+            self._text_features = features
+        return features
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FormStructure:
     """Represents a form and its fields."""
     
@@ -137,7 +172,7 @@ class FormStructure:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PageSection:
     """Represents a major section of the page."""
     
@@ -165,7 +200,7 @@ class PageSection:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NavigationArea:
     """Represents a navigation area on the page."""
     
@@ -189,7 +224,7 @@ class NavigationArea:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ContentArea:
     """Represents a main content area."""
     
@@ -213,7 +248,7 @@ class ContentArea:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SidebarArea:
     """Represents a sidebar area."""
     
@@ -230,7 +265,7 @@ class SidebarArea:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HeaderFooterInfo:
     """Information about page header and footer."""
     
@@ -258,7 +293,7 @@ class HeaderFooterInfo:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NavigationStructure:
     """Overall navigation structure of the page."""
     
@@ -279,7 +314,7 @@ class NavigationStructure:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SemanticBlock:
     """Represents a semantically meaningful block of content."""
     
@@ -304,7 +339,7 @@ class SemanticBlock:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PageStructure:
     """Overall structure of the page."""
     
@@ -331,7 +366,7 @@ class PageStructure:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DOMAnalysisResult:
     """Complete result of DOM analysis."""
     
@@ -349,7 +384,7 @@ class DOMAnalysisResult:
     performance_hints: Dict[str, Any] = field(default_factory=dict)
     
     # Element relationships and mappings
-    element_relationships: Dict[str, List[str]] = field(default_factory=dict)
+    element_relationships: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     element_index: Dict[str, InteractiveElement] = field(default_factory=dict)
     
     # Analysis metadata
@@ -374,6 +409,10 @@ class DOMAnalysisResult:
         """Get an interactive element by ID."""
         return self.element_index.get(element_id)
     
+    def get_element_relationships(self, element_id: str) -> Optional[Dict[str, Any]]:
+        """Get the parent, children and siblings of an element by ID."""
+        return self.element_relationships.get(element_id)
+    
     def get_elements_by_type(self, element_type: ElementType) -> List[InteractiveElement]:
         """Get all interactive elements of a specific type."""
         return [elem for elem in self.interactive_elements if elem.element_type == element_type]
@@ -388,11 +427,9 @@ class DOMAnalysisResult:
     
     def get_clickable_elements(self) -> List[InteractiveElement]:
         """Get all elements that can be clicked."""
-        return [elem for elem in self.interactive_elements 
+        return [elem for elem in self.interactive_elements
                 if InteractionType.CLICK in elem.interaction_types]
     
     def get_form_fields(self) -> List[InteractiveElement]:
         """Get all form field elements."""
-        form_element_types = {ElementType.INPUT, ElementType.TEXTAREA, ElementType.SELECT, 
-                            ElementType.CHECKBOX, ElementType.RADIO}
-        return [elem for elem in self.interactive_elements if elem.element_type in form_element_types]
\ No newline at end of file
+        return [elem for elem in self.interactive_elements if elem.element_type in _FORM_FIELD_ELEMENT_TYPES]
\ No newline at end of file
@@ -6,7 +6,7 @@ used throughout the DOM analysis process.
 """
 
 from enum import Enum, auto
-from typing import Set
+from typing import FrozenSet
 
 
 class ElementType(Enum):
@@ -225,76 +225,87 @@ class AccessibilityRole(Enum):
 
 # Helper functions and mappings
 
-def get_interactive_element_types() -> Set[ElementType]:
+# Built once at import; the helpers below hand out these shared,
+# immutable sets
+_INTERACTIVE_ELEMENT_TYPES = frozenset({
+    ElementType.BUTTON,
+    ElementType.LINK,
+    ElementType.INPUT,
+    ElementType.TEXTAREA,
+    ElementType.SELECT,
+    ElementType.CHECKBOX,
+    ElementType.RADIO,
+    ElementType.FILE_INPUT,
+    ElementType.SUBMIT,
+    ElementType.FORM,
+})
+
+_CONTENT_ELEMENT_TYPES = frozenset({
+    ElementType.TEXT,
+    ElementType.IMAGE,
+    ElementType.VIDEO,
+    ElementType.AUDIO,
+    ElementType.TABLE,
+    ElementType.LIST,
+    ElementType.HEADING,
+    ElementType.PARAGRAPH,
+})
+
+_STRUCTURAL_ELEMENT_TYPES = frozenset({
+    ElementType.NAVIGATION,
+    ElementType.HEADER,
+    ElementType.FOOTER,
+    ElementType.MAIN,
+    ElementType.ASIDE,
+    ElementType.SECTION,
+    ElementType.ARTICLE,
+    ElementType.DIV,
+    ElementType.SPAN,
+})
+
+_FORM_FIELD_TYPES = frozenset({
+    FormFieldType.TEXT,
+    FormFieldType.EMAIL,
+    FormFieldType.PASSWORD,
+    FormFieldType.PHONE,
+    FormFieldType.URL,
+    FormFieldType.SEARCH,
+    FormFieldType.NUMBER,
+    FormFieldType.RANGE,
+    FormFieldType.DATE,
+    FormFieldType.TIME,
+    FormFieldType.DATETIME,
+    FormFieldType.MONTH,
+    FormFieldType.WEEK,
+    FormFieldType.SELECT,
+    FormFieldType.MULTISELECT,
+    FormFieldType.RADIO,
+    FormFieldType.CHECKBOX,
+    FormFieldType.FILE,
+    FormFieldType.IMAGE,
+    FormFieldType.COLOR,
+    FormFieldType.TEXTAREA,
+})
+
+
+def get_interactive_element_types() -> FrozenSet[ElementType]:
     """Get all element types that are interactive."""
-    return {
-        ElementType.BUTTON,
-        ElementType.LINK,
-        ElementType.INPUT,
-        ElementType.TEXTAREA,
-        ElementType.SELECT,
-        ElementType.CHECKBOX,
-        ElementType.RADIO,
-        ElementType.FILE_INPUT,
-        ElementType.SUBMIT,
-        ElementType.FORM,
-    }
-
-
-def get_content_element_types() -> Set[ElementType]:
+    return _INTERACTIVE_ELEMENT_TYPES
+
+
+def get_content_element_types() -> FrozenSet[ElementType]:
     """Get all element types that are primarily content."""
-    return {
-        ElementType.TEXT,
-        ElementType.IMAGE,
-        ElementType.VIDEO,
-        ElementType.AUDIO,
-        ElementType.TABLE,
-        ElementType.LIST,
-        ElementType.HEADING,
-        ElementType.PARAGRAPH,
-    }
-
-
-def get_structural_element_types() -> Set[ElementType]:
+    return _CONTENT_ELEMENT_TYPES
+
+
+def get_structural_element_types() -> FrozenSet[ElementType]:
     """Get all element types that are structural."""
-    return {
-        ElementType.NAVIGATION,
-        ElementType.HEADER,
-        ElementType.FOOTER,
-        ElementType.MAIN,
-        ElementType.ASIDE,
-        ElementType.SECTION,
-        ElementType.ARTICLE,
-        ElementType.DIV,
-        ElementType.SPAN,
-    }
-
-
-def get_form_field_types() -> Set[FormFieldType]:
+    return _STRUCTURAL_ELEMENT_TYPES
+
+
+def get_form_field_types() -> FrozenSet[FormFieldType]:
     """Get all form field types that can accept user input."""
-    return {
-        FormFieldType.TEXT,
-        FormFieldType.EMAIL,
-        FormFieldType.PASSWORD,
-        FormFieldType.PHONE,
-        FormFieldType.URL,
-        FormFieldType.SEARCH,
-        FormFieldType.NUMBER,
-        FormFieldType.RANGE,
-        FormFieldType.DATE,
-        FormFieldType.TIME,
-        FormFieldType.DATETIME,
-        FormFieldType.MONTH,
-        FormFieldType.WEEK,
-        FormFieldType.SELECT,
-        FormFieldType.MULTISELECT,
-        FormFieldType.RADIO,
-        FormFieldType.CHECKBOX,
-        FormFieldType.FILE,
-        FormFieldType.IMAGE,
-        FormFieldType.COLOR,
-        FormFieldType.TEXTAREA,
-    }
+    return _FORM_FIELD_TYPES
 
 
 # Element type mappings for HTML tags
@@ -336,6 +347,10 @@ HTML_TAG_TO_ELEMENT_TYPE = {
 }
 
 
+# ARIA role attribute value to accessibility role mapping
+ARIA_ROLE_TO_ACCESSIBILITY_ROLE = {role.value: role for role in AccessibilityRole}
+
+
 # Input type to form field type mapping
 INPUT_TYPE_TO_FORM_FIELD_TYPE = {
     'text': FormFieldType.TEXT,
@@ -1,7 +1,12 @@
 from .css_selector_generator import CSSSelectorsGenerator
 from .xpath_generator import XPathGenerator
+from .tag_index import TagIndex, analysis_scope, get_tag_index, invalidate_tree_caches
 
 __all__ = [
     "CSSSelectorsGenerator",
     "XPathGenerator",
+    "TagIndex",
+    "get_tag_index",
+    "analysis_scope",
+    "invalidate_tree_caches",
 ]
\ No newline at end of file
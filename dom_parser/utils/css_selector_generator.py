@@ -5,10 +5,107 @@ Generates multiple CSS selector strategies for DOM elements,
 providing fallback options for reliable element location.
 """
 
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from itertools import combinations
+from typing import Optional, List, Dict, Any, Tuple
 from bs4 import BeautifulSoup, Tag
 import re
 
+from .tag_index import analysis_scope, get_tag_index, get_tree_cache
+
+
+# Names that read the same as CSS identifiers, so tag.class selectors built
+# from them can be counted from the tag index instead of run through select()
+_PLAIN_TAG_NAME_RE = re.compile(r'^[a-z][a-z0-9_-]*$')
+_PLAIN_CLASS_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_-]*$')
+_PLAIN_ATTRIBUTE_NAME_RE = re.compile(r'^[a-z_][a-z0-9_-]*$')
+# Characters a quoted attribute value cannot hold unescaped
+_CSS_STRING_SPECIAL_RE = re.compile(r'[\\\r\n\f]')
+
+# Class names that look like generated IDs, matched against the lowercased name
+_GENERATED_CLASS_RE = re.compile(r'^[a-f0-9]{8,}$')
+
+# Utility classes that are likely to be non-unique: display keywords,
+# margin/padding and width/height steps, text alignment/colour and
+# background utilities, as one alternation
+_UTILITY_CLASS_RE = re.compile(
+    r'^(?:hidden|visible|flex|block|inline|[mp][tblr]?-?\d+|[wh]-?\d+|(?:text|bg)-\w+)$',
+    re.IGNORECASE,
+)
+
+_VALID_ID_RE = re.compile(r'^[a-zA-Z][\w-]*$')
+
+# Attributes tried for a unique selector, in priority order, before any
+# other data- attribute
+_PRIORITY_ATTRIBUTES = ('name', 'data-testid', 'data-cy', 'data-test', 'data-automation')
+_PRIORITY_ATTRIBUTE_SET = frozenset(_PRIORITY_ATTRIBUTES)
+_CSS_ESCAPE_RE = re.compile(r'([^a-zA-Z0-9_-])')
+# Backslash-escapes both quote characters in attribute values and text
+_QUOTE_ESCAPE_TABLE = str.maketrans({'"': '\\"', "'": "\\'"})
+
+
+# Class names and IDs repeat across a page, so their checks and escapes are memoized
+@lru_cache(maxsize=4096)
+def _is_meaningful_class_name(class_name: str) -> bool:
+    """Check if a class name is meaningful for CSS selection."""
+    # Avoid generated/random class names
+    if len(class_name) < 2:
+        return False
+    
+    # Avoid classes that look like generated IDs
+    if _GENERATED_CLASS_RE.match(class_name.lower()):
+        return False
+    
+    # Avoid utility classes that are likely to be non-unique
+    return not _UTILITY_CLASS_RE.match(class_name)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_id_value(element_id: str) -> bool:
+    """Check if an ID is valid and meaningful."""
+    if not element_id or len(element_id) < 1:
+        return False
+    
+    # Check CSS identifier validity
+    if not _VALID_ID_RE.match(element_id):
+        return False
+    
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _escape_css_identifier_value(identifier: str) -> str:
+    """Escape CSS identifier for use in selectors."""
+    # Basic escaping - in practice might need more sophisticated escaping
+    return _CSS_ESCAPE_RE.sub(r'\\\1', identifier)
+
+
+def _select_summary(soup: BeautifulSoup, selector: str) -> Tuple[int, Optional[Tag]]:
+    """
+    Run a selector against the tree once and remember what it matched.
+    
+    Candidate selectors repeat across the elements of a page (every
+    hierarchical path shares its ancestors' parts), so the number of
+    matches and the first match are cached for the open analysis scope
+    of the tree.
+    
+    Args:
+        soup: BeautifulSoup DOM tree
+        selector: CSS selector
+        
+    Returns:
+        Tuple of (number of matches, first match or None)
+    """
+    tree_cache = get_tree_cache(soup)
+    cache = tree_cache.setdefault('selector_matches', {}) if tree_cache is not None else {}
+    
+    summary = cache.get(selector)
+    if summary is None:
+        matches = soup.select(selector)
+        summary = (len(matches), matches[0] if matches else None)
+        cache[selector] = summary
+    return summary
+
 
 class CSSSelectorsGenerator:
     """
@@ -30,8 +127,13 @@ class CSSSelectorsGenerator:
         self.prefer_ids = self.config.get('prefer_ids', True)
         self.prefer_classes = self.config.get('prefer_classes', True)
         self.avoid_indices = self.config.get('avoid_indices', False)
+        # Largest number of classes combined into one selector; the number
+        # of combinations grows exponentially with the class count
+        self.max_class_combo = self.config.get('max_class_combo', 3)
+        # id(element) -> (id, classes, meaningful classes), reset per call
+        self._element_cache: Dict[int, Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...]]] = {}
     
-    async def generate_selector(self, element: Tag, soup: BeautifulSoup) -> str:
+    def generate_selector(self, element: Tag, soup: BeautifulSoup) -> str:
         """
         Generate the best CSS selector for the element.
         
@@ -42,42 +144,53 @@ class CSSSelectorsGenerator:
         Returns:
             CSS selector string
         """
-        # Try different selector strategies in order of preference
-        selectors = []
+        with analysis_scope(soup):
+            self._element_cache = {}
+            
+            # Try different selector strategies in order of preference and
+            # return the first (most reliable) one that produces a selector
+            
+            # 1. ID-based selector (most reliable)
+            if (id_selector := self._generate_id_selector(element)):
+                return id_selector
+            
+            # 2. Unique attribute selector
+            if (attr_selector := self._generate_unique_attribute_selector(element, soup)):
+                return attr_selector
+            
+            # 3. Class-based selector
+            if (class_selector := self._generate_class_selector(element, soup)):
+                return class_selector
+            
+            # 4. Hierarchical selector
+            if (hierarchical_selector := self._generate_hierarchical_selector(element, soup)):
+                return hierarchical_selector
+            
+            # 5. Text-based selector
+            if (text_selector := self._generate_text_selector(element)):
+                return text_selector
+            
+            # 6. Fallback: nth-child selector
+            if (nth_selector := self._generate_nth_child_selector(element)):
+                return nth_selector
+            
+            return self._generate_fallback_selector(element)
+    
+    async def generate_selector_async(self, element: Tag, soup: BeautifulSoup) -> str:
+        """
+        Awaitable form of generate_selector.
+        
+        generate_selector does no I/O and is synchronous; this wrapper keeps
+        code written against its earlier async signature working.
         
-        # 1. ID-based selector (most reliable)
-        id_selector = self._generate_id_selector(element)
-        if id_selector:
-            selectors.append(id_selector)
-        
-        # 2. Unique attribute selector
-        attr_selector = self._generate_unique_attribute_selector(element, soup)
-        if attr_selector:
-            selectors.append(attr_selector)
-        
-        # 3. Class-based selector
-        class_selector = self._generate_class_selector(element, soup)
-        if class_selector:
-            selectors.append(class_selector)
-        
-        # 4. Hierarchical selector
-        hierarchical_selector = self._generate_hierarchical_selector(element, soup)
-        if hierarchical_selector:
-            selectors.append(hierarchical_selector)
-        
-        # 5. Text-based selector
-        text_selector = self._generate_text_selector(element)
-        if text_selector:
-            selectors.append(text_selector)
-        
-        # 6. Fallback: nth-child selector
-        if not selectors or self.config.get('include_nth_child', False):
-            nth_selector = self._generate_nth_child_selector(element)
-            if nth_selector:
-                selectors.append(nth_selector)
-        
-        # Return the first (most reliable) selector
-        return selectors[0] if selectors else self._generate_fallback_selector(element)
+        Args:
+            element: Target BeautifulSoup Tag element
+            soup: Full DOM tree for context
+            
+        Returns:
+            CSS selector string
+        """
+        return self.generate_selector(element, soup)
     
     def generate_all_selectors(self, element: Tag, soup: BeautifulSoup) -> List[str]:
         """
@@ -90,84 +203,88 @@ class CSSSelectorsGenerator:
         Returns:
             List of CSS selector strings
         """
-        selectors = []
-        
-        # ID selector
-        id_selector = self._generate_id_selector(element)
-        if id_selector:
-            selectors.append(id_selector)
-        
-        # Unique attribute selectors
-        attr_selector = self._generate_unique_attribute_selector(element, soup)
-        if attr_selector:
-            selectors.append(attr_selector)
-        
-        # Class selectors
-        class_selectors = self._generate_all_class_selectors(element, soup)
-        selectors.extend(class_selectors)
-        
-        # Text selectors
-        text_selector = self._generate_text_selector(element)
-        if text_selector:
-            selectors.append(text_selector)
-        
-        # Hierarchical selectors
-        hierarchical_selectors = self._generate_hierarchical_selectors(element, soup)
-        selectors.extend(hierarchical_selectors)
-        
-        # Remove duplicates while preserving order
-        unique_selectors = []
-        for selector in selectors:
-            if selector not in unique_selectors:
-                unique_selectors.append(selector)
-        
-        return unique_selectors
+        with analysis_scope(soup):
+            self._element_cache = {}
+            selectors = []
+            
+            # ID selector
+            id_selector = self._generate_id_selector(element)
+            if id_selector:
+                selectors.append(id_selector)
+            
+            # Unique attribute selectors
+            attr_selector = self._generate_unique_attribute_selector(element, soup)
+            if attr_selector:
+                selectors.append(attr_selector)
+            
+            # Class selectors
+            class_selectors = self._generate_all_class_selectors(element, soup)
+            selectors.extend(class_selectors)
+            
+            # Text selectors
+            text_selector = self._generate_text_selector(element)
+            if text_selector:
+                selectors.append(text_selector)
+            
+            # Hierarchical selectors
+            hierarchical_selectors = self._generate_hierarchical_selectors(element, soup)
+            selectors.extend(hierarchical_selectors)
+            
+            # Remove duplicates while preserving order
+            unique_selectors = []
+            for selector in selectors:
+                if selector not in unique_selectors:
+                    unique_selectors.append(selector)
+            
+            return unique_selectors
     
     def _generate_id_selector(self, element: Tag) -> Optional[str]:
         """Generate ID-based CSS selector."""
-        element_id = element.get('id')
+        element_id = self._element_info(element)[0]
         if element_id and self._is_valid_id(element_id):
             return f"#{self._escape_css_identifier(element_id)}"
         return None
     
     def _generate_unique_attribute_selector(self, element: Tag, soup: BeautifulSoup) -> Optional[str]:
         """Generate selector based on unique attributes."""
-        # Priority attributes for uniqueness
-        unique_attrs = ['name', 'data-testid', 'data-cy', 'data-test', 'data-automation']
+        attrs = element.attrs
         
-        for attr_name in unique_attrs:
-            attr_value = element.get(attr_name)
+        # Priority attributes for uniqueness
+        for attr_name in _PRIORITY_ATTRIBUTES:
+            attr_value = attrs.get(attr_name)
             if attr_value:
                 # Check if this attribute value is unique in the document
                 selector = f"[{attr_name}=\"{self._escape_attribute_value(attr_value)}\"]"
-                if self._is_selector_unique(selector, element, soup):
+                if self._is_attribute_unique(selector, attr_name, attr_value, element, soup):
                     return selector
         
         # Try other data attributes
-        for attr_name, attr_value in element.attrs.items():
-            if attr_name.startswith('data-') and attr_name not in unique_attrs:
+        for attr_name, attr_value in attrs.items():
+            if attr_name.startswith('data-') and attr_name not in _PRIORITY_ATTRIBUTE_SET:
                 selector = f"[{attr_name}=\"{self._escape_attribute_value(attr_value)}\"]"
-                if self._is_selector_unique(selector, element, soup):
+                if self._is_attribute_unique(selector, attr_name, attr_value, element, soup):
                     return selector
         
         return None
     
     def _generate_class_selector(self, element: Tag, soup: BeautifulSoup) -> Optional[str]:
         """Generate class-based CSS selector."""
-        classes = element.get('class', [])
+        _, classes, meaningful_classes = self._element_info(element)
         if not classes:
             return None
         
         # Try single classes first
-        for class_name in classes:
-            if self._is_meaningful_class(class_name):
-                selector = f".{self._escape_css_identifier(class_name)}"
-                if self._is_selector_unique(selector, element, soup):
+        for class_name in meaningful_classes:
+            selector = f".{self._escape_css_identifier(class_name)}"
+            if _PLAIN_CLASS_NAME_RE.match(class_name):
+                # The element carries the class, so a single match is the element
+                if get_tag_index(soup).count_with_class('*', class_name) == 1:
                     return selector
+            elif self._is_selector_unique(selector, element, soup):
+                return selector
         
         # Try combinations of classes
         if len(classes) > 1:
-            meaningful_classes = [c for c in classes if self._is_meaningful_class(c)]
             if meaningful_classes:
                 class_selector = '.' + '.'.join(self._escape_css_identifier(c) for c in meaningful_classes)
                 if self._is_selector_unique(class_selector, element, soup):
@@ -178,23 +295,20 @@ class CSSSelectorsGenerator:
     def _generate_all_class_selectors(self, element: Tag, soup: BeautifulSoup) -> List[str]:
         """Generate all possible class-based selectors."""
         selectors = []
-        classes = element.get('class', [])
+        _, classes, meaningful_classes = self._element_info(element)
         
         if not classes:
             return selectors
         
         # Single class selectors
-        for class_name in classes:
-            if self._is_meaningful_class(class_name):
-                selector = f".{self._escape_css_identifier(class_name)}"
-                selectors.append(selector)
+        for class_name in meaningful_classes:
+            selector = f".{self._escape_css_identifier(class_name)}"
+            selectors.append(selector)
         
         # Combined class selectors
-        meaningful_classes = [c for c in classes if self._is_meaningful_class(c)]
         if len(meaningful_classes) > 1:
-            # All combinations
-            for i in range(2, len(meaningful_classes) + 1):
-                from itertools import combinations
+            # Combinations of up to max_class_combo classes
+            for i in range(2, min(len(meaningful_classes), self.max_class_combo) + 1):
                 for combo in combinations(meaningful_classes, i):
                     class_selector = '.' + '.'.join(self._escape_css_identifier(c) for c in combo)
                     selectors.append(class_selector)
@@ -284,27 +398,27 @@ class CSSSelectorsGenerator:
         if not element.parent:
             return None
         
-        # Find position among siblings of same type
-        siblings = [child for child in element.parent.children 
-                   if hasattr(child, 'name') and child.name == element.name]
-        
-        try:
-            position = siblings.index(element) + 1  # CSS is 1-based
-            return f"{element.name}:nth-child({position})"
-        except ValueError:
-            return None
+        # Find position among siblings of same type, matching the element by
+        # identity: Tag equality is structural, so identical siblings would
+        # otherwise all report the first position
+        position = 0  # CSS is 1-based
+        for child in element.parent.children:
+            if getattr(child, 'name', None) == element.name:
+                position += 1
+                if child is element:
+                    return f"{element.name}:nth-child({position})"
+        return None
     
     def _generate_element_part(self, element: Tag, soup: BeautifulSoup) -> Optional[str]:
         """Generate CSS selector part for a single element."""
         parts = [element.name]
+        element_id, _, meaningful_classes = self._element_info(element)
         
         # Add ID if available
-        if element.get('id') and self.prefer_ids:
-            return f"{element.name}#{self._escape_css_identifier(element.get('id'))}"
+        if element_id and self.prefer_ids:
+            return f"{element.name}#{self._escape_css_identifier(element_id)}"
         
         # Add classes if available and meaningful
-        classes = element.get('class', [])
-        meaningful_classes = [c for c in classes if self._is_meaningful_class(c)]
         
         if meaningful_classes and self.prefer_classes:
             # Use first meaningful class
@@ -312,11 +426,40 @@ class CSSSelectorsGenerator:
             test_selector = f"{element.name}{class_part}"
             
             # Check if this makes the selector more specific
-            if len(soup.select(test_selector)) < len(soup.select(element.name)):
+            if _PLAIN_TAG_NAME_RE.match(element.name) and _PLAIN_CLASS_NAME_RE.match(meaningful_classes[0]):
+                tag_index = get_tag_index(soup)
+                more_specific = (tag_index.count_with_class(element.name, meaningful_classes[0])
+                                 < tag_index.count(element.name))
+            else:
+                more_specific = _select_summary(soup, test_selector)[0] < _select_summary(soup, element.name)[0]
+            if more_specific:
                 parts.append(class_part)
         
         return ''.join(parts) if parts else None
     
+    def _element_info(self, element: Tag) -> Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Get an element's id, classes and meaningful classes.
+        
+        Several strategies (and every descendant's hierarchical walk) read
+        the same attributes, so they are looked up and filtered once per
+        element within a generate_selector or generate_all_selectors call.
+        
+        Args:
+            element: BeautifulSoup Tag element
+            
+        Returns:
+            Tuple of (id or None, classes, meaningful classes)
+        """
+        key = id(element)
+        info = self._element_cache.get(key)
+        if info is None:
+            classes = tuple(element.get('class', ()))
+            meaningful_classes = tuple(c for c in classes if self._is_meaningful_class(c))
+            info = (element.get('id'), classes, meaningful_classes)
+            self._element_cache[key] = info
+        return info
+    
     def _generate_fallback_selector(self, element: Tag) -> str:
         """Generate a fallback selector when all else fails."""
         return element.name
@@ -324,57 +467,57 @@ class CSSSelectorsGenerator:
     def _is_selector_unique(self, selector: str, target_element: Tag, soup: BeautifulSoup) -> bool:
         """Check if selector uniquely identifies the target element."""
         try:
-            selected_elements = soup.select(selector)
-            return len(selected_elements) == 1 and selected_elements[0] == target_element
+            count, first = _select_summary(soup, selector)
+            return count == 1 and first == target_element
         except Exception:
             return False
     
-    def _is_meaningful_class(self, class_name: str) -> bool:
-        """Check if a class name is meaningful for CSS selection."""
-        # Avoid generated/random class names
-        if len(class_name) < 2:
-            return False
+    def _is_attribute_unique(self, selector: str, attr_name: str, attr_value: Any,
+                             element: Tag, soup: BeautifulSoup) -> bool:
+        """
+        Check if an [attr_name="attr_value"] selector uniquely identifies the element.
         
-        # Avoid classes that look like generated IDs
-        if re.match(r'^[a-f0-9]{8,}$', class_name.lower()):
-            return False
+        Plain names and values are answered from the tree's attribute
+        counts instead of running the selector; anything that needs CSS
+        escaping still goes through soupsieve.
         
-        # Avoid utility classes that are likely to be non-unique
-        utility_patterns = [
-            r'^(hidden|visible|flex|block|inline)$',
-            r'^(mt?|mb?|ml?|mr?|pt?|pb?|pl?|pr?)-?\d+$',  # Margin/padding utilities
-            r'^(w|h)-?\d+$',  # Width/height utilities
-            r'^text-(left|right|center)$',
-            r'^bg-\w+$',  # Background utilities
-            r'^text-\w+$',  # Text color utilities
-        ]
-        
-        for pattern in utility_patterns:
-            if re.match(pattern, class_name, re.IGNORECASE):
-                return False
-        
-        return True
+        Args:
+            selector: The attribute selector built from attr_name and attr_value
+            attr_name: Attribute name
+            attr_value: The element's value for the attribute
+            element: Target BeautifulSoup Tag element
+            soup: Full DOM tree for context
+            
+        Returns:
+            True if the selector matches only the element
+        """
+        if (isinstance(attr_value, str) and _PLAIN_ATTRIBUTE_NAME_RE.match(attr_name)
+                and not _CSS_STRING_SPECIAL_RE.search(attr_value)):
+            tag_index = get_tag_index(soup)
+            # soupsieve matches values against ^value$, which also accepts
+            # the value followed by a single trailing newline
+            count = (tag_index.count_with_attribute(attr_name, attr_value)
+                     + tag_index.count_with_attribute(attr_name, attr_value + '\n'))
+            # The element itself holds the value, so a single match is the element
+            return count == 1
+        return self._is_selector_unique(selector, element, soup)
+    
+    def _is_meaningful_class(self, class_name: str) -> bool:
+        """Check if a class name is meaningful for CSS selection."""
+        return _is_meaningful_class_name(class_name)
     
     def _is_valid_id(self, element_id: str) -> bool:
         """Check if an ID is valid and meaningful."""
-        if not element_id or len(element_id) < 1:
-            return False
-        
-        # Check CSS identifier validity
-        if not re.match(r'^[a-zA-Z][\w-]*$', element_id):
-            return False
-        
-        return True
+        return _is_valid_id_value(element_id)
     
     def _escape_css_identifier(self, identifier: str) -> str:
         """Escape CSS identifier for use in selectors."""
-        # Basic escaping - in practice might need more sophisticated escaping
-        return re.sub(r'([^a-zA-Z0-9_-])', r'\\\1', identifier)
+        return _escape_css_identifier_value(identifier)
     
     def _escape_attribute_value(self, value: str) -> str:
         """Escape attribute value for use in selectors."""
-        return value.replace('"', '\\"').replace("'", "\\'")
+        return value.translate(_QUOTE_ESCAPE_TABLE)
     
     def _escape_text_content(self, text: str) -> str:
         """Escape text content for use in selectors."""
-        return text.replace("'", "\\'").replace('"', '\\"')
\ No newline at end of file
+        return text.translate(_QUOTE_ESCAPE_TABLE)
\ No newline at end of file
@@ -0,0 +1,464 @@
+"""
+Tag Index for single-pass element lookups.
+
+Walks a parsed DOM tree once and buckets elements by tag name, so that
+the analyzers can share one traversal instead of each re-walking the
+whole document with find_all.
+
+The index, and anything else derived from the tree, is only shared
+inside an analysis scope; outside one, every lookup starts from the tree
+as it currently is, so changes made to the tree between analyses are
+never hidden by a stale cache.
+"""
+
+import inspect
+import re
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+
+# String types get_text() collects for ordinary elements; <script>, <style>,
+# <template> and ruby text elements collect their own special string types
+DEFAULT_STRING_TYPES = frozenset({NavigableString, CData})
+
+# Class attribute separators as CSS (and soupsieve) define them
+_CLASS_NAME_RE = re.compile(r'[^ \t\r\n\f]+')
+
+
+class TagIndex:
+    """
+    Document-order index of the elements in a DOM tree.
+
+    Built in a single pass over the tree; lookups by tag name are dict
+    reads and results keep the same order find_all would return.
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        """
+        Build the index from a DOM tree.
+
+        Args:
+            soup: BeautifulSoup DOM tree to index
+        """
+        self.elements: List[Tag] = []
+        self.by_tag: Dict[str, List[Tag]] = {}
+        self.text_node_count = 0
+        self._positions: Dict[int, int] = {}
+        self._texts: Dict[int, str] = {}
+        self._tag_positions: Dict[str, List[int]] = {}
+        self._class_counts: Dict[str, Counter] = {}
+        self._attribute_indexes: Dict[str, Dict[str, Tag]] = {}
+        self._attribute_counts: Dict[str, Counter] = {}
+        self._subtree_ends: Optional[List[int]] = None
+
+        for node in soup.descendants:
+            if isinstance(node, Tag):
+                self._positions[id(node)] = len(self.elements)
+                self.elements.append(node)
+                self.by_tag.setdefault(node.name, []).append(node)
+            elif node:
+                # Every other node is a string (text, comment, doctype, ...);
+                # empty ones are skipped, as find_all(string=True) does
+                self.text_node_count += 1
+
+    @property
+    def total_elements(self) -> int:
+        """Number of elements in the tree."""
+        return len(self.elements)
+
+    def find(self, name: str) -> Optional[Tag]:
+        """Return the first element with the given tag name, if any."""
+        bucket = self.by_tag.get(name)
+        return bucket[0] if bucket else None
+
+    def find_all(self, names: Union[str, Iterable[str]]) -> List[Tag]:
+        """
+        Return all elements matching one or more tag names.
+
+        Args:
+            names: Tag name or iterable of tag names
+
+        Returns:
+            Matching elements in document order
+        """
+        if isinstance(names, str):
+            return list(self.by_tag.get(names, ()))
+
+        buckets = [self.by_tag[name] for name in set(names) if name in self.by_tag]
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            return list(buckets[0])
+
+        merged = [element for bucket in buckets for element in bucket]
+        merged.sort(key=lambda element: self._positions[id(element)])
+        return merged
+
+    def find_all_within(self, element: Tag, names: Union[str, Iterable[str]]) -> List[Tag]:
+        """
+        Return the descendants of an element matching one or more tag names.
+
+        Equivalent to element.find_all(names), but the element's subtree is
+        a contiguous run of document positions, so each tag bucket is
+        sliced by bisection instead of walking the subtree.
+
+        Args:
+            element: Element from the indexed tree
+            names: Tag name or iterable of tag names
+
+        Returns:
+            Matching descendants in document order
+        """
+        if isinstance(names, str):
+            names = (names,)
+
+        start, end = self.subtree_range(element)
+        matches = []
+        for name in set(names):
+            bucket = self.by_tag.get(name)
+            if not bucket:
+                continue
+            positions = self._tag_positions_for(name)
+            matches.extend(bucket[bisect_right(positions, start):bisect_right(positions, end)])
+
+        matches.sort(key=lambda tag: self._positions[id(tag)])
+        return matches
+
+    def count_within(self, element: Tag, names: Union[str, Iterable[str]]) -> int:
+        """
+        Return len(element.find_all(names)) without building the list.
+
+        Args:
+            element: Element from the indexed tree
+            names: Tag name or iterable of tag names
+
+        Returns:
+            Number of matching descendants
+        """
+        if isinstance(names, str):
+            names = (names,)
+
+        start, end = self.subtree_range(element)
+        total = 0
+        for name in set(names):
+            if name in self.by_tag:
+                positions = self._tag_positions_for(name)
+                total += bisect_right(positions, end) - bisect_right(positions, start)
+        return total
+
+    def count(self, name: str) -> int:
+        """Return the number of elements with the given tag name."""
+        return len(self.by_tag.get(name, ()))
+
+    def count_with_class(self, name: str, class_name: str) -> int:
+        """
+        Return the number of elements matching the selector name.class_name.
+
+        Class counts are tallied once per tag name, so repeated queries
+        for a tag are dict reads rather than document-wide selects.
+
+        Args:
+            name: Tag name, or '*' for elements of any name
+            class_name: Unescaped class name
+
+        Returns:
+            Number of elements with that tag name carrying the class
+        """
+        counts = self._class_counts.get(name)
+        if counts is None:
+            counts = Counter()
+            tags = self.elements if name == '*' else self.by_tag.get(name, ())
+            for tag in tags:
+                classes = tag.get('class')
+                if not classes:
+                    continue
+                if isinstance(classes, str):
+                    classes = _CLASS_NAME_RE.findall(classes)
+                counts.update(set(classes))
+            self._class_counts[name] = counts
+        return counts[class_name]
+
+    def find_by_attribute(self, attribute: str, value: str) -> Optional[Tag]:
+        """
+        Return the first element whose attribute equals the given value.
+
+        Each attribute is indexed on first use, so repeated lookups (by
+        id or name, say) are dict reads rather than document-wide finds.
+        Meant for single-valued attributes such as id and name.
+
+        Args:
+            attribute: Attribute name
+            value: Exact attribute value
+
+        Returns:
+            First matching element in document order, or None
+        """
+        index = self._attribute_indexes.get(attribute)
+        if index is None:
+            self._index_attribute(attribute)
+            index = self._attribute_indexes[attribute]
+        return index.get(value)
+
+    def count_with_attribute(self, attribute: str, value: str) -> int:
+        """
+        Return the number of elements whose attribute equals the given value.
+
+        Counted in the same pass that indexes the attribute for
+        find_by_attribute, and likewise meant for single-valued attributes.
+
+        Args:
+            attribute: Attribute name
+            value: Exact attribute value
+
+        Returns:
+            Number of matching elements
+        """
+        counts = self._attribute_counts.get(attribute)
+        if counts is None:
+            self._index_attribute(attribute)
+            counts = self._attribute_counts[attribute]
+        return counts[value]
+
+    def _index_attribute(self, attribute: str) -> None:
+        """Record the first element and the count for each value of an attribute."""
+        index = {}
+        counts = Counter()
+        for tag in self.elements:
+            tag_value = tag.attrs.get(attribute)
+            if isinstance(tag_value, str):
+                index.setdefault(tag_value, tag)
+                counts[tag_value] += 1
+        self._attribute_indexes[attribute] = index
+        self._attribute_counts[attribute] = counts
+
+    def sibling_position(self, element: Tag) -> int:
+        """
+        Return the element's index in element.parent.find_all(element.name).
+
+        The parent's descendants occupy a contiguous run of document
+        positions, so the index is found by bisecting the positions of the
+        element's tag bucket instead of searching the parent's subtree.
+
+        Args:
+            element: Element from the indexed tree
+
+        Returns:
+            Position among the parent's same-tag descendants, 0 for a root
+        """
+        parent = element.parent
+        if parent is None:
+            return 0
+
+        positions = self._tag_positions_for(element.name)
+
+        # The BeautifulSoup object itself is not indexed and precedes everything
+        parent_position = self._positions.get(id(parent), -1)
+        return (bisect_left(positions, self._positions[id(element)])
+                - bisect_right(positions, parent_position))
+
+    def _tag_positions_for(self, name: str) -> List[int]:
+        """Return the document positions of a tag bucket, in order."""
+        positions = self._tag_positions.get(name)
+        if positions is None:
+            positions = [self._positions[id(tag)] for tag in self.by_tag.get(name, ())]
+            self._tag_positions[name] = positions
+        return positions
+
+    def subtree_range(self, element: Tag) -> Tuple[int, int]:
+        """
+        Return the element's document position and that of its last descendant.
+
+        Subtree ends are filled in for the whole tree on first use, in one
+        backwards pass: an element's subtree ends where its last child
+        element's subtree does.
+
+        Args:
+            element: Element from the indexed tree
+
+        Returns:
+            (position, end) such that the element's descendants are exactly
+            the elements at positions position + 1 through end
+        """
+        ends = self._subtree_ends
+        if ends is None:
+            positions = self._positions
+            ends = list(range(len(self.elements)))
+            for position in range(len(self.elements) - 1, -1, -1):
+                for child in reversed(self.elements[position].contents):
+                    if isinstance(child, Tag):
+                        ends[position] = ends[positions[id(child)]]
+                        break
+            self._subtree_ends = ends
+
+        position = self._positions[id(element)]
+        return position, ends[position]
+
+    def title_text(self) -> Optional[str]:
+        """
+        Return the stripped text of the document's first <title>.
+
+        A title normally holds a single text node, which is read directly;
+        get_text is only needed when a lenient parser left markup inside it.
+
+        Returns:
+            Title text, or None when the document has no <title>
+        """
+        title = self.find('title')
+        if title is None:
+            return None
+        text = title.string
+        if text is not None:
+            return text.strip()
+        return title.get_text(strip=True)
+
+    def text(self, element: Tag) -> str:
+        """
+        Return the same text as element.get_text(strip=True).
+
+        Text is assembled bottom-up from the children, and every subtree's
+        text is kept, so asking for an ancestor after its descendants (or
+        the other way round) does not walk the shared part of the tree again.
+
+        Args:
+            element: Element from the indexed tree
+
+        Returns:
+            Stripped text content of the element
+        """
+        if element.interesting_string_types != DEFAULT_STRING_TYPES:
+            return element.get_text(strip=True)
+
+        texts = self._texts
+        text = texts.get(id(element))
+        if text is not None:
+            return text
+
+        # Iterative post-order walk; each element is joined once its children are
+        stack = [(element, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                parts = []
+                for child in node.contents:
+                    if isinstance(child, Tag):
+                        child_text = texts[id(child)]
+                        if child_text:
+                            parts.append(child_text)
+                    elif type(child) in DEFAULT_STRING_TYPES:
+                        child_text = child.strip()
+                        if child_text:
+                            parts.append(child_text)
+                texts[id(node)] = ''.join(parts)
+            else:
+                stack.append((node, True))
+                stack.extend(
+                    (child, False) for child in node.contents
+                    if isinstance(child, Tag) and id(child) not in texts
+                )
+        return texts[id(element)]
+
+
+@contextmanager
+def analysis_scope(soup: BeautifulSoup) -> Iterator[None]:
+    """
+    Share the caches derived from a DOM tree for the duration of the block.
+
+    Scopes nest; the caches are dropped when the outermost scope exits, so
+    they never outlive an analysis the tree could be changed after.
+
+    Args:
+        soup: BeautifulSoup DOM tree
+    """
+    # Read through vars() so BS4's attribute-as-find() lookup is bypassed
+    state = vars(soup)
+    depth = state.get('_tree_cache_depth', 0)
+    if depth == 0:
+        soup._tree_cache = {}
+    soup._tree_cache_depth = depth + 1
+    try:
+        yield
+    finally:
+        # Re-read the depth: concurrent analyses of one tree may exit in any order
+        depth = state['_tree_cache_depth'] - 1
+        soup._tree_cache_depth = depth
+        if depth == 0:
+            state.pop('_tree_cache', None)
+
+
+def analysis_scoped(method: Callable) -> Callable:
+    """
+    Run an analyzer method inside an analysis_scope for its DOM tree.
+
+    Args:
+        method: Sync or async method with the signature (self, soup, ...)
+
+    Returns:
+        Wrapped method
+    """
+    if inspect.iscoroutinefunction(method):
+        @wraps(method)
+        async def scoped(self, soup, *args, **kwargs):
+            with analysis_scope(soup):
+                return await method(self, soup, *args, **kwargs)
+    else:
+        @wraps(method)
+        def scoped(self, soup, *args, **kwargs):
+            with analysis_scope(soup):
+                return method(self, soup, *args, **kwargs)
+    return scoped
+
+
+def get_tree_cache(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+    """
+    Get the cache shared by the analyses of a DOM tree.
+
+    Args:
+        soup: BeautifulSoup DOM tree
+
+    Returns:
+        The open analysis scope's cache, or None outside any scope
+    """
+    return vars(soup).get('_tree_cache')
+
+
+def invalidate_tree_caches(soup: BeautifulSoup) -> None:
+    """
+    Drop everything cached for a DOM tree in the open analysis scope.
+
+    Call this after changing the tree inside a scope; the caches are
+    rebuilt from the changed tree on next use.
+
+    Args:
+        soup: BeautifulSoup DOM tree
+    """
+    cache = get_tree_cache(soup)
+    if cache is not None:
+        cache.clear()
+
+
+def get_tag_index(soup: BeautifulSoup) -> TagIndex:
+    """
+    Get the TagIndex for a DOM tree.
+
+    Inside an analysis scope the index is built on first use and shared,
+    so every analyzer that receives the same soup shares a single
+    traversal. Outside one, a fresh index of the current tree is built.
+
+    Args:
+        soup: BeautifulSoup DOM tree
+
+    Returns:
+        TagIndex for the tree
+    """
+    cache = get_tree_cache(soup)
+    if cache is None:
+        return TagIndex(soup)
+    index = cache.get('tag_index')
+    if index is None:
+        index = TagIndex(soup)
+        cache['tag_index'] = index
+    return index
@@ -5,6 +5,7 @@ Generates XPath expressions for DOM elements using various strategies,
 providing fallback options for reliable element location.
 """
 
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 import re
 try:
@@ -15,6 +16,55 @@ except ImportError:
     Tag = Any
 
 
+# Class names that look like generated IDs, matched against the lowercased name
+_GENERATED_CLASS_RE = re.compile(r'^[a-f0-9]{8,}$')
+
+# Utility classes that are likely to be non-unique: display keywords,
+# margin/padding and width/height steps, text alignment/colour and
+# background utilities, as one alternation
+_UTILITY_CLASS_RE = re.compile(
+    r'^(?:hidden|visible|flex|block|inline|[mp][tblr]?-?\d+|[wh]-?\d+|(?:text|bg)-\w+)$',
+    re.IGNORECASE,
+)
+
+# XPaths that match whole classes of elements
+_GENERIC_XPATH_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'^//\*$',  # Any element
+    r'^//div$',  # Any div
+    r'^//span$',  # Any span
+))
+
+_VALID_ID_RE = re.compile(r'^[a-zA-Z][\w-]*$')
+
+
+# Class names and IDs repeat across a page, so their checks are memoized
+@lru_cache(maxsize=4096)
+def _is_meaningful_class_name(class_name: str) -> bool:
+    """Check if a class name is meaningful for XPath selection."""
+    if len(class_name) < 2:
+        return False
+    
+    # Avoid generated/random class names
+    if _GENERATED_CLASS_RE.match(class_name.lower()):
+        return False
+    
+    # Avoid utility classes
+    return not _UTILITY_CLASS_RE.match(class_name)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_id_value(element_id: str) -> bool:
+    """Check if an ID is valid and meaningful."""
+    if not element_id or len(element_id) < 1:
+        return False
+    
+    # Basic validation
+    if not _VALID_ID_RE.match(element_id):
+        return False
+    
+    return True
+
+
 class XPathGenerator:
     """
     Generates XPath expressions for DOM elements using various strategies.
@@ -36,7 +86,7 @@ class XPathGenerator:
         self.prefer_attributes = self.config.get('prefer_attributes', True)
         self.use_text_content = self.config.get('use_text_content', True)
     
-    async def generate_xpath(self, element: Tag, soup: BeautifulSoup) -> str:
+    def generate_xpath(self, element: Tag, soup: BeautifulSoup) -> str:
         """
         Generate the best XPath for the element.
         
@@ -79,6 +129,22 @@ class XPathGenerator:
         # Return the first (most reliable) XPath
         return xpaths[0] if xpaths else self._generate_fallback_xpath(element)
     
+    async def generate_xpath_async(self, element: Tag, soup: BeautifulSoup) -> str:
+        """
+        Awaitable form of generate_xpath.
+        
+        generate_xpath does no I/O and is synchronous; this wrapper keeps
+        code written against its earlier async signature working.
+        
+        Args:
+            element: Target BeautifulSoup Tag element
+            soup: Full DOM tree for context
+            
+        Returns:
+            XPath expression string
+        """
+        return self.generate_xpath(element, soup)
+    
     def generate_all_xpaths(self, element: Tag, soup: BeautifulSoup) -> List[str]:
         """
         Generate all possible XPath expressions for the element.
@@ -302,21 +368,17 @@ class XPathGenerator:
             return None
         
         # Find position among siblings of same type
-        siblings = [child for child in element.parent.children 
-                   if hasattr(child, 'name') and child.name == element.name]
-        
-        try:
-            position = siblings.index(element) + 1  # XPath is 1-based
-            tag_name = element.name
-            
-            # Generate parent path
-            parent_path = self._generate_simple_parent_path(element.parent)
-            if parent_path:
-                return f"{parent_path}/{tag_name}[{position}]"
-            else:
-                return f"//{tag_name}[{position}]"
-        except ValueError:
+        position = self._sibling_position(element)
+        if position is None:
             return None
+        tag_name = element.name
+        
+        # Generate parent path
+        parent_path = self._generate_simple_parent_path(element.parent)
+        if parent_path:
+            return f"{parent_path}/{tag_name}[{position}]"
+        else:
+            return f"//{tag_name}[{position}]"
     
     def _generate_element_xpath_part(self, element: Tag, soup: BeautifulSoup) -> Optional[str]:
         """Generate XPath part for a single element."""
@@ -369,14 +431,25 @@ class XPathGenerator:
         if not element.parent:
             return element.name
         
-        siblings = [child for child in element.parent.children 
-                   if hasattr(child, 'name') and child.name == element.name]
-        
-        try:
-            position = siblings.index(element) + 1
-            return f"{element.name}[{position}]"
-        except ValueError:
+        position = self._sibling_position(element)
+        if position is None:
             return element.name
+        return f"{element.name}[{position}]"
+    
+    def _sibling_position(self, element: Tag) -> Optional[int]:
+        """
+        Get the 1-based XPath position of an element among same-named siblings.
+        
+        Siblings are matched by identity: Tag equality is structural, so
+        identical siblings would otherwise all report the first position.
+        """
+        position = 0
+        for child in element.parent.children:
+            if getattr(child, 'name', None) == element.name:
+                position += 1
+                if child is element:
+                    return position
+        return None
     
     def _generate_simple_parent_path(self, parent: Tag, max_depth: int = 3) -> Optional[str]:
         """Generate simple path to parent element."""
@@ -432,53 +505,19 @@ class XPathGenerator:
     
     def _is_xpath_too_generic(self, xpath: str) -> bool:
         """Check if XPath is too generic to be useful."""
-        generic_patterns = [
-            r'^//\*$',  # Any element
-            r'^//div$',  # Any div
-            r'^//span$',  # Any span
-        ]
-        
-        for pattern in generic_patterns:
-            if re.match(pattern, xpath):
+        for pattern in _GENERIC_XPATH_PATTERNS:
+            if pattern.match(xpath):
                 return True
         
         return False
     
     def _is_meaningful_class(self, class_name: str) -> bool:
         """Check if a class name is meaningful for XPath selection."""
-        if len(class_name) < 2:
-            return False
-        
-        # Avoid generated/random class names
-        if re.match(r'^[a-f0-9]{8,}$', class_name.lower()):
-            return False
-        
-        # Avoid utility classes
-        utility_patterns = [
-            r'^(hidden|visible|flex|block|inline)$',
-            r'^(mt?|mb?|ml?|mr?|pt?|pb?|pl?|pr?)-?\d+$',
-            r'^(w|h)-?\d+$',
-            r'^text-(left|right|center)$',
-            r'^bg-\w+$',
-            r'^text-\w+$',
-        ]
-        
-        for pattern in utility_patterns:
-            if re.match(pattern, class_name, re.IGNORECASE):
-                return False
-        
-        return True
+        return _is_meaningful_class_name(class_name)
     
     def _is_valid_id(self, element_id: str) -> bool:
         """Check if an ID is valid and meaningful."""
-        if not element_id or len(element_id) < 1:
-            return False
-        
-        # Basic validation
-        if not re.match(r'^[a-zA-Z][\w-]*$', element_id):
-            return False
-        
-        return True
+        return _is_valid_id_value(element_id)
     
     def _escape_xpath_string(self, value: str) -> str:
         """Escape string for use in XPath expressions."""
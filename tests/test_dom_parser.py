@@ -87,6 +87,21 @@ class TestDOMParser:
         except Exception as e:
             pytest.skip(f"Complex parsing not available: {e}")
     
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, sample_html):
+        """Test that cache hits refresh an entry so it outlives newer ones."""
+        parser = DOMParser({'max_cache_size': 2})
+        first = await parser.parse_page(sample_html, "https://a.example.com")
+        await parser.parse_page(sample_html, "https://b.example.com")
+        
+        # Touch the first entry, then push a third one in
+        assert await parser.parse_page(sample_html, "https://a.example.com") is first
+        await parser.parse_page(sample_html, "https://c.example.com")
+        
+        assert len(parser._analysis_cache) == 2
+        assert parser._generate_cache_key(sample_html, "https://a.example.com") in parser._analysis_cache
+        assert parser._generate_cache_key(sample_html, "https://b.example.com") not in parser._analysis_cache
+    
     def test_interactive_element_detection(self, parser, sample_html):
         """Test detection of interactive elements."""
         # Test element classifier directly since it's the core component
@@ -139,6 +154,86 @@ class TestDOMParser:
         analyzer = AccessibilityAnalyzer()
         assert analyzer is not None
 
+    def test_element_accessibility_role_lookup(self):
+        """Test that ARIA role values resolve to AccessibilityRole members."""
+        from bs4 import BeautifulSoup
+        from dom_parser.analyzers.accessibility_analyzer import AccessibilityAnalyzer
+        from dom_parser.types.element_data_types import AccessibilityRole
+        
+        soup = BeautifulSoup('<div role="Navigation"></div><div role="widget"></div>', 'html.parser')
+        known, unknown = soup.find_all('div')
+        analyzer = AccessibilityAnalyzer()
+        
+        assert analyzer.extract_element_accessibility(known).role == AccessibilityRole.NAVIGATION
+        info = analyzer.extract_element_accessibility(unknown)
+        assert info.role is None
+        assert info.attributes['role'] == 'widget'
+
+    @pytest.mark.asyncio
+    async def test_main_landmark_detection(self):
+        """Test that both <main> and role="main" count as the main landmark."""
+        from bs4 import BeautifulSoup
+        from dom_parser.analyzers.accessibility_analyzer import AccessibilityAnalyzer
+        from dom_parser.types.element_data_types import AccessibilityRole
+        
+        analyzer = AccessibilityAnalyzer()
+        for html in ('<main>Content</main>', '<div role="main">Content</div>'):
+            info = await analyzer.analyze_accessibility(BeautifulSoup(html, 'html.parser'))
+            assert info.role == AccessibilityRole.MAIN
+        
+        info = await analyzer.analyze_accessibility(BeautifulSoup('<div>Content</div>', 'html.parser'))
+        assert info.role is None
+
+    def test_elements_by_type_follow_list_changes(self):
+        """Test that type lookups reflect elements added, replaced or changed after a lookup."""
+        from dom_parser.types.dom_data_types import InteractiveElement, PageStructure
+        
+        result = DOMAnalysisResult(page_structure=PageStructure())
+        result.interactive_elements.append(InteractiveElement("b1", ElementType.BUTTON, "button"))
+        assert [e.element_id for e in result.get_elements_by_type(ElementType.BUTTON)] == ["b1"]
+        
+        result.interactive_elements.append(InteractiveElement("b2", ElementType.BUTTON, "button"))
+        assert [e.element_id for e in result.get_elements_by_type(ElementType.BUTTON)] == ["b1", "b2"]
+        assert result.get_elements_by_type(ElementType.LINK) == []
+        assert len(result.get_elements_by_semantic_type(None)) == 2
+        
+        result.interactive_elements[0] = InteractiveElement("l1", ElementType.LINK, "a")
+        result.interactive_elements[1].element_type = ElementType.LINK
+        assert result.get_elements_by_type(ElementType.BUTTON) == []
+        assert [e.element_id for e in result.get_elements_by_type(ElementType.LINK)] == ["l1", "b2"]
+    
+    def test_clickable_and_form_fields_follow_element_changes(self):
+        """Test that clickable and form-field lookups reflect elements changed after a lookup."""
+        from dom_parser.types.dom_data_types import InteractiveElement, PageStructure
+        
+        result = DOMAnalysisResult(page_structure=PageStructure(), interactive_elements=[
+            InteractiveElement("b1", ElementType.BUTTON, "button", interaction_types=[InteractionType.CLICK]),
+            InteractiveElement("i1", ElementType.INPUT, "input"),
+        ])
+        assert [e.element_id for e in result.get_clickable_elements()] == ["b1"]
+        assert [e.element_id for e in result.get_form_fields()] == ["i1"]
+        
+        result.interactive_elements[0].interaction_types = []
+        result.interactive_elements[1] = InteractiveElement("s1", ElementType.SELECT, "select",
+                                                            interaction_types=[InteractionType.CLICK])
+        assert [e.element_id for e in result.get_clickable_elements()] == ["s1"]
+        assert [e.element_id for e in result.get_form_fields()] == ["s1"]
+    
+    def test_form_lookup_follows_form_changes(self):
+        """Test that form lookups reflect forms replaced or renamed after a lookup."""
+        from dom_parser.types.dom_data_types import FormStructure, PageStructure
+        
+        result = DOMAnalysisResult(page_structure=PageStructure(),
+                                   form_structures=[FormStructure("login", "f1")])
+        assert result.get_form_by_id("login").form_element_id == "f1"
+        
+        result.form_structures[0] = FormStructure("login", "f2")
+        assert result.get_form_by_id("login").form_element_id == "f2"
+        
+        result.form_structures[0].form_id = "signup"
+        assert result.get_form_by_id("login") is None
+        assert result.get_form_by_id("signup").form_element_id == "f2"
+
 class TestElementClassifier:
     """Test cases for ElementClassifier."""
     
@@ -202,6 +297,49 @@ class TestElementClassifier:
         assert main is not None, "Should find main element"
         assert nav is not None, "Should find nav element" 
         assert footer is not None, "Should find footer element"
+    
+    @pytest.mark.asyncio
+    async def test_identical_siblings_get_distinct_ids(self, classifier):
+        """Test that structurally identical siblings are not given the same ID."""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(
+            '<ul><li role="link">Item</li><li role="link">Item</li><li role="link">Item</li></ul>',
+            'html.parser'
+        )
+        
+        elements = await classifier.classify_elements(soup)
+        
+        assert [element.element_id for element in elements] == ['li_0_item', 'li_1_item', 'li_2_item']
+    
+    @pytest.mark.asyncio
+    async def test_interaction_types_are_not_repeated(self, classifier):
+        """Test that a button with an onclick handler reports CLICK once."""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup('<button onclick="go()">Go</button>', 'html.parser')
+        
+        elements = await classifier.classify_elements(soup)
+        
+        assert elements[0].interaction_types == [
+            InteractionType.CLICK, InteractionType.FOCUS, InteractionType.BLUR
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_semantic_pattern_edits_take_effect(self, classifier):
+        """Test that editing semantic_patterns changes later classifications."""
+        from bs4 import BeautifulSoup
+        from dom_parser.types.element_data_types import SemanticType
+        html = '<button>View trolley</button>'
+        
+        elements = await classifier.classify_elements(BeautifulSoup(html, 'html.parser'))
+        assert elements[0].semantic_type is None
+        
+        classifier.semantic_patterns[SemanticType.CART].append('trolley')
+        elements = await classifier.classify_elements(BeautifulSoup(html, 'html.parser'))
+        assert elements[0].semantic_type == SemanticType.CART
+        
+        classifier.semantic_patterns = {SemanticType.WISHLIST: ['trolley']}
+        elements = await classifier.classify_elements(BeautifulSoup(html, 'html.parser'))
+        assert elements[0].semantic_type == SemanticType.WISHLIST
 
 class TestSemanticExtractor:
     """Test cases for SemanticExtractor."""
@@ -336,6 +474,116 @@ class TestHTMLAnalyzer:
         soup = BeautifulSoup(malformed_html, 'html.parser')
         assert soup is not None
         assert soup.find('body') is not None
+    
+    def test_dom_statistics_depth_on_deep_tree(self):
+        """Test that depth is measured without recursing per level."""
+        from bs4 import BeautifulSoup
+        from dom_parser.analyzers.html_analyzer import HTMLAnalyzer
+        
+        soup = BeautifulSoup('<div>' * 2000 + 'deep', 'html.parser')
+        stats = HTMLAnalyzer().get_dom_statistics(soup)
+        assert stats['depth'] == 2000
+    
+    def test_dom_statistics_follow_tree_changes(self):
+        """Test that statistics are recomputed after the tree changes and are not shared."""
+        from bs4 import BeautifulSoup
+        from dom_parser.analyzers.html_analyzer import HTMLAnalyzer
+        from dom_parser.utils.tag_index import analysis_scope
+        
+        soup = BeautifulSoup('<div><p>a</p><p>b</p></div>', 'html.parser')
+        analyzer = HTMLAnalyzer()
+        stats = analyzer.get_dom_statistics(soup)
+        assert stats['total_elements'] == 3
+        
+        stats['total_elements'] = -1
+        soup.p.decompose()
+        assert analyzer.get_dom_statistics(soup)['total_elements'] == 2
+        
+        with analysis_scope(soup):
+            analyzer.get_dom_statistics(soup)['tag_counts']['p'] = 0
+            assert analyzer.get_dom_statistics(soup)['tag_counts']['p'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_extract_metadata_only(self, sample_html):
+        """Test that head-only parsing yields the same metadata as a full parse."""
+        from dom_parser.analyzers.html_analyzer import HTMLAnalyzer
+        analyzer = HTMLAnalyzer()
+        
+        full = analyzer.extract_metadata(await analyzer.parse_html(sample_html))
+        head_only = await analyzer.extract_metadata_only(sample_html)
+        
+        assert head_only['title'] == full['title']
+        assert head_only == dict(full, language=None)
+
+class TestStructureMapper:
+    """Test cases for StructureMapper."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('logo', [
+        '<img src="/logo.png">',
+        '<a class="logo" href="/">Brand</a>',
+        '<div id="logo">Brand</div>',
+    ])
+    async def test_header_logo_detection(self, logo):
+        """Test that the header logo is found by tag, class or id."""
+        from bs4 import BeautifulSoup
+        from dom_parser.core.structure_mapper import StructureMapper
+        
+        soup = BeautifulSoup(f'<header>{logo}</header>', 'html.parser')
+        structure = await StructureMapper().map_page_structure(soup)
+        assert structure.header_footer.logo == "logo_elem"
+
+class TestCSSSelectorsGenerator:
+    """Test cases for CSSSelectorsGenerator."""
+    
+    def test_nth_child_selector_for_identical_siblings(self):
+        """Test that structurally identical siblings get their own positions."""
+        from bs4 import BeautifulSoup
+        from dom_parser.utils.css_selector_generator import CSSSelectorsGenerator
+        
+        soup = BeautifulSoup('<ul><li>Item</li><li>Item</li></ul>', 'html.parser')
+        generator = CSSSelectorsGenerator()
+        selectors = [generator._generate_nth_child_selector(li) for li in soup.find_all('li')]
+        assert selectors == ['li:nth-child(1)', 'li:nth-child(2)']
+    
+    @pytest.mark.parametrize("button,selector", [
+        ('<button class="save">Save</button>', '.save'),
+        ('<button data-testid="save">Save</button>', '[data-testid="save"]'),
+    ])
+    def test_selector_uniqueness_follows_tree_changes(self, button, selector):
+        """Test that a selector stops being used once the tree gains a second match."""
+        from bs4 import BeautifulSoup
+        from dom_parser.utils.css_selector_generator import CSSSelectorsGenerator
+        
+        soup = BeautifulSoup(f'<div>{button}</div>', 'html.parser')
+        generator = CSSSelectorsGenerator()
+        assert generator.generate_selector(soup.button, soup) == selector
+        
+        soup.div.append(BeautifulSoup(button, 'html.parser').button)
+        assert len(soup.select(selector)) == 2
+        assert all(generator.generate_selector(b, soup) != selector for b in soup.find_all('button'))
+    
+    def test_selector_match_counts_follow_tree_changes(self):
+        """Test that a tag-name selector stops being used once it matches twice."""
+        from bs4 import BeautifulSoup
+        from dom_parser.utils.css_selector_generator import CSSSelectorsGenerator
+        
+        soup = BeautifulSoup('<div><p><span>x</span></p></div>', 'html.parser')
+        generator = CSSSelectorsGenerator()
+        assert generator.generate_selector(soup.span, soup) == 'span'
+        
+        soup.div.append(BeautifulSoup('<p><span>y</span></p>', 'html.parser').p)
+        assert generator.generate_selector(soup.span, soup) != 'span'
+    
+    @pytest.mark.asyncio
+    async def test_generate_selector_async(self):
+        """Test that the awaitable wrapper returns the synchronous result."""
+        from bs4 import BeautifulSoup
+        from dom_parser.utils.css_selector_generator import CSSSelectorsGenerator
+        
+        soup = BeautifulSoup('<button id="save">Save</button>', 'html.parser')
+        generator = CSSSelectorsGenerator()
+        assert await generator.generate_selector_async(soup.button, soup) == '#save'
 
 # Integration tests
 class TestIntegration: